@@ -0,0 +1,9 @@
+-- 006_memo_lookup_indexes.sql: Indexes for cross-run memo lookups and run listings.
+-- get_latest filters on (namespace, key) ORDER BY id DESC LIMIT 1;
+-- list_entries filters on (run_id, namespace) ORDER BY step, id.
+
+CREATE INDEX IF NOT EXISTS ix_memo_entries_ns_key_id
+    ON memo_entries(namespace, key, id DESC);
+
+CREATE INDEX IF NOT EXISTS ix_memo_entries_run_ns_step
+    ON memo_entries(run_id, namespace, step, id);
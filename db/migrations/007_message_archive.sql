@@ -0,0 +1,14 @@
+-- 007_message_archive.sql: Messages evicted from the planner context window.
+-- append_messages inserts one row per eviction; load_archived_messages reads
+-- a run's rows back in id order.
+
+CREATE TABLE IF NOT EXISTS message_archive (
+    id            SERIAL PRIMARY KEY,
+    run_id        TEXT NOT NULL,
+    step          INTEGER NOT NULL,
+    messages_json TEXT NOT NULL,
+    created_at    TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS ix_message_archive_run
+    ON message_archive(run_id, id);
@@ -1,8 +1,8 @@
 # agent_state.py
 
-import hashlib
 import json
 from dataclasses import dataclass, field
+from hashlib import blake2b
 from typing import Literal, TypedDict
 
 
@@ -24,7 +24,11 @@ class AgentState:
         content: str,
         name: str | None = None,
     ) -> None:
+        """Append a message; history is append-only.
 
+        The system prompt stays ``messages[0]`` and is never rewritten, so every
+        turn shares an identical prefix that provider-side prompt/KV caches reuse.
+        """
         message: AgentMessage = {
             "role": role,
             "content": content,
@@ -36,8 +40,9 @@ class AgentState:
         self.messages.append(message)
 
     def register_tool_call(self, tool_name: str, args: dict):
-        signature_raw = tool_name + json.dumps(args, sort_keys=True)
-        signature = hashlib.sha256(signature_raw.encode()).hexdigest()
+        # Dedup key only, never persisted: a short blake2b digest is enough.
+        signature_raw = tool_name + "\x00" + json.dumps(args, sort_keys=True)
+        signature = blake2b(signature_raw.encode(), digest_size=16).hexdigest()
 
         if signature in self.seen_tool_calls:
             return False
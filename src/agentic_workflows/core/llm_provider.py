@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import json
 import os
+import sqlite3
+import threading
+import time
 from collections.abc import Sequence
+from hashlib import blake2b
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -12,6 +17,8 @@ from openai import OpenAI
 
 from agentic_workflows.core.agent_state import AgentMessage
 from agentic_workflows.errors import LLMError
+from agentic_workflows.http_client import shared_http_client
+from agentic_workflows.json_mode import json_mode_supported, record_json_mode_rejection
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
 load_dotenv(dotenv_path=ROOT_DIR / ".env")
@@ -32,6 +39,43 @@ def _resolve_ollama_base_url(base_url: str | None = None) -> str:
     return "http://localhost:11434/v1"
 
 
+class _CompletionCache:
+    """SQLite-backed completion store keyed by a digest of (provider, model, messages)."""
+
+    def __init__(self, db_path: str) -> None:
+        path = Path(db_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS completions ("
+            "key BLOB PRIMARY KEY, content TEXT NOT NULL, created REAL NOT NULL)"
+        )
+
+    @staticmethod
+    def key(provider_name: str, model: str, messages: Sequence[AgentMessage]) -> bytes:
+        canonical = json.dumps(list(messages), sort_keys=True, ensure_ascii=False)
+        return blake2b(
+            f"{provider_name}\x1f{model}\x1f{canonical}".encode(), digest_size=16
+        ).digest()
+
+    def get(self, key: bytes) -> str | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content FROM completions WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: bytes, content: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO completions (key, content, created) VALUES (?, ?, ?)",
+                (key, content, time.time()),
+            )
+
+
 class LLMProvider:
     """Provider adapter for the non-LangGraph orchestrator.
 
@@ -40,6 +84,9 @@ class LLMProvider:
     2) `LLM_PROVIDER` from environment
     3) `P1_PROVIDER` from environment
     4) default: `ollama`
+
+    Set `LLM_RESPONSE_CACHE_PATH` to a SQLite file to replay stored completions
+    for identical (provider, model, messages) requests instead of calling the model.
     """
 
     def __init__(
@@ -54,21 +101,28 @@ class LLMProvider:
             .strip()
         )
 
+        # Only the Ollama endpoint is configurable; Groq/OpenAI use the SDK default.
+        self.base_url = ""
         if provider_name == "groq":
             api_key = os.getenv("GROQ_API_KEY")
             if not api_key:
                 raise ValueError("GROQ_API_KEY not found in environment.")
-            self.client = Groq(api_key=api_key)
+            self.client = Groq(api_key=api_key, http_client=shared_http_client())
             self.model = model or os.getenv("GROQ_MODEL", "llama-3.3-70b-versatile")
         elif provider_name == "openai":
             api_key = os.getenv("OPENAI_API_KEY")
             if not api_key:
                 raise ValueError("OPENAI_API_KEY not found in environment.")
-            self.client = OpenAI(api_key=api_key)
+            self.client = OpenAI(api_key=api_key, http_client=shared_http_client())
             self.model = model or os.getenv("OPENAI_MODEL", "gpt-4.1-mini")
         elif provider_name == "ollama":
             resolved_base_url = _resolve_ollama_base_url(base_url)
-            self.client = OpenAI(api_key="ollama", base_url=resolved_base_url)
+            self.client = OpenAI(
+                api_key="ollama",
+                base_url=resolved_base_url,
+                http_client=shared_http_client(),
+            )
+            self.base_url = resolved_base_url
             self.model = model or os.getenv("OLLAMA_MODEL", "llama3.1:8b")
         else:
             raise ValueError(
@@ -76,18 +130,39 @@ class LLMProvider:
             )
 
         self.provider_name = provider_name
-
-    def generate(self, messages: Sequence[AgentMessage]) -> str:
+        cache_path = os.getenv("LLM_RESPONSE_CACHE_PATH", "").strip()
+        self._cache = _CompletionCache(cache_path) if cache_path else None
+
+    def generate(self, messages: Sequence[AgentMessage], *, no_cache: bool = False) -> str:
+        cache = None if no_cache else self._cache
+        if cache is None:
+            return self._generate_uncached(messages)
+        key = cache.key(self.provider_name, self.model, messages)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+        content = self._generate_uncached(messages)
+        cache.put(key, content)
+        return content
+
+    def _generate_uncached(self, messages: Sequence[AgentMessage]) -> str:
         try:
             if self.provider_name == "ollama":
-                try:
-                    response = self.client.chat.completions.create(
-                        model=self.model,
-                        messages=list(messages),
-                        response_format={"type": "json_object"},
-                    )
-                except Exception:
-                    # Some local OpenAI-compatible layers do not support response_format.
+                response = None
+                if json_mode_supported(self.provider_name, self.base_url, self.model):
+                    try:
+                        response = self.client.chat.completions.create(
+                            model=self.model,
+                            messages=list(messages),
+                            response_format={"type": "json_object"},
+                        )
+                    except Exception as exc:
+                        # Fall back to plain mode for this call; only an explicit
+                        # response_format rejection disables JSON mode for later turns.
+                        record_json_mode_rejection(
+                            exc, self.provider_name, self.base_url, self.model
+                        )
+                if response is None:
                     response = self.client.chat.completions.create(
                         model=self.model,
                         messages=list(messages),
@@ -1,11 +1,15 @@
 # orchestrator.py
 
+import asyncio
 import json
-from typing import Any
+import reprlib
+import weakref
+from functools import lru_cache
+from typing import Annotated, Any
 
-from pydantic import ValidationError
+from pydantic import Field, TypeAdapter, ValidationError
 
-from agentic_workflows.core.agent_state import AgentState
+from agentic_workflows.core.agent_state import AgentMessage, AgentState
 from agentic_workflows.core.llm_provider import LLMProvider
 from agentic_workflows.errors import (
     FatalAgentError,
@@ -25,28 +29,42 @@ from agentic_workflows.tools.sort_array import SortArrayTool
 from agentic_workflows.tools.string_ops import StringOpsTool
 from agentic_workflows.tools.write_file import WriteFileTool
 
+_ACTION_ADAPTER: TypeAdapter[ToolAction | FinishAction] = TypeAdapter(
+    Annotated[ToolAction | FinishAction, Field(discriminator="action")]
+)
 
-class Orchestrator:
-    def __init__(self):
-        self.llm = LLMProvider()
-        self.logger = get_logger("orchestrator")
-        self.tools = {
-            "repeat_message": EchoTool(),
-            "sort_array": SortArrayTool(),
-            "string_ops": StringOpsTool(),
-            "math_stats": MathStatsTool(),
-            "write_file": WriteFileTool(),
-            "memoize": MemoizeTool(),
-        }
-        self.max_steps = 20  # raised to handle multi-task sequences
+# Per-step feedback messages; only the counters, tool name and payload vary.
+_TOOL_RESULT_TEMPLATE = (
+    "TOOL_RESULT — Tool call #{count} completed (tool: '{tool}'):\n"
+    "{payload}\n\n"
+    "You have now completed {count} tool call(s).\n"
+    "What is the NEXT task? Call the appropriate tool for it.\n"
+    "If ALL tasks from the user request are done, emit finish.\n"
+    "Respond with ONE valid JSON object only."
+)
+_DUPLICATE_CALL_TEMPLATE = (
+    "ERROR: You just called '{tool}' with the same arguments as a previous call. "
+    "This is a duplicate — do NOT repeat it.\n"
+    "You have completed {count} tool call(s) so far.\n"
+    "Move on to the NEXT uncompleted task. Respond with ONE valid JSON object."
+)
+
+# Bounded repr for tools_used snippets: large strings/lists are truncated while
+# walking, instead of rendering the whole result just to keep 120 chars.
+_SNIPPET_REPR = reprlib.Repr(maxlevel=3, maxdict=8, maxlist=8, maxstring=120, maxother=120)
 
-        available_tools = list(self.tools.keys())
-        tool_list_str = "\n".join(
-            f"- {name}: {tool.description}" for name, tool in self.tools.items()
-        )
-        tool_names_str = ", ".join(available_tools)
 
-        self.system_prompt = f"""
+@lru_cache(maxsize=4)
+def _build_system_prompt(tool_signature: tuple[tuple[str, str], ...]) -> str:
+    """Render the system prompt for a ``(name, description)`` tool signature.
+
+    The prompt only depends on the registered tools, so repeated
+    ``Orchestrator()`` constructions share one rendered string.
+    """
+    tool_list_str = "\n".join(f"- {name}: {description}" for name, description in tool_signature)
+    tool_names_str = ", ".join(name for name, _ in tool_signature)
+
+    return f"""
 You are a deterministic tool-using agent.
 You MUST respond ONLY with valid JSON. No markdown, no explanations, no extra text.
 
@@ -165,6 +183,35 @@ STRICT RULES
 - Use ONLY the "args" field names shown in TOOL ARG REFERENCE.
 """
 
+
+class Orchestrator:
+    def __init__(self):
+        self.llm = LLMProvider()
+        self.logger = get_logger("orchestrator")
+        self.tools = {
+            "repeat_message": EchoTool(),
+            "sort_array": SortArrayTool(),
+            "string_ops": StringOpsTool(),
+            "math_stats": MathStatsTool(),
+            "write_file": WriteFileTool(),
+            "memoize": MemoizeTool(),
+        }
+        self.max_steps = 20  # raised to handle multi-task sequences
+        # Recent messages sent verbatim each step; older ones are folded into a
+        # progress summary built from tools_used. 0 sends the full transcript.
+        self.history_window = 6
+        # Caps how many arun() calls execute at once; extra callers wait their turn.
+        self.max_concurrent_runs = 4
+        # One semaphore per running loop: asyncio primitives bind to the loop that
+        # first waits on them.
+        self._run_semaphores: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+
+        self.system_prompt = _build_system_prompt(
+            tuple((name, tool.description) for name, tool in self.tools.items())
+        )
+
     def run(self, user_input: str):
 
         state = AgentState(
@@ -178,13 +225,13 @@ STRICT RULES
         tools_used: list = []  # ordered log of every tool call: (name, result_snippet)
 
         for step in range(self.max_steps):
-            self.logger.info(f"Step {step + 1}/{self.max_steps}")
+            self.logger.info("Step %d/%d", step + 1, self.max_steps)
             state.step = step
 
             try:
                 #  Call LLM
-                model_output = self.llm.generate(state.messages).strip()
-                self.logger.info(f"MODEL OUTPUT:\n{model_output}")
+                model_output = self.llm.generate(self._llm_messages(state, tools_used)).strip()
+                self.logger.info("MODEL OUTPUT:\n%s", model_output)
 
                 # Add model's output to conversation history as assistant turn
                 # This is critical — without it the model has no memory of what it said
@@ -201,11 +248,8 @@ STRICT RULES
                         # Give model a chance to recover rather than hard crash
                         state.add_message(
                             role="system",
-                            content=(
-                                f"ERROR: You just called '{action.tool_name}' with the same "
-                                f"arguments as a previous call. This is a duplicate — do NOT repeat it.\n"
-                                f"You have completed {tool_call_count} tool call(s) so far.\n"
-                                "Move on to the NEXT uncompleted task. Respond with ONE valid JSON object."
+                            content=_DUPLICATE_CALL_TEMPLATE.format(
+                                tool=action.tool_name, count=tool_call_count
                             ),
                         )
                         continue
@@ -214,7 +258,7 @@ STRICT RULES
                     tool_call_count += 1
 
                     # Record in the run-level tools_used log
-                    result_snippet = str(tool_result)[:120]
+                    result_snippet = _SNIPPET_REPR.repr(tool_result)[:120]
                     tools_used.append(
                         {
                             "call": tool_call_count,
@@ -226,14 +270,13 @@ STRICT RULES
 
                     state.add_message(
                         role="system",
-                        content=(
-                            f"TOOL_RESULT — Tool call #{tool_call_count} completed "
-                            f"(tool: '{action.tool_name}'):\n"
-                            f"{json.dumps(tool_result)}\n\n"
-                            f"You have now completed {tool_call_count} tool call(s).\n"
-                            "What is the NEXT task? Call the appropriate tool for it.\n"
-                            "If ALL tasks from the user request are done, emit finish.\n"
-                            "Respond with ONE valid JSON object only."
+                        content=_TOOL_RESULT_TEMPLATE.format(
+                            count=tool_call_count,
+                            tool=action.tool_name,
+                            # Compact, non-escaped form: fewer prompt tokens every step.
+                            payload=json.dumps(
+                                tool_result, separators=(",", ":"), ensure_ascii=False, default=str
+                            ),
                         ),
                     )
 
@@ -243,17 +286,19 @@ STRICT RULES
                 if isinstance(action, FinishAction):
                     # Log the full run summary
                     self.logger.info("=" * 60)
-                    self.logger.info(f"RUN SUMMARY — {tool_call_count} tool call(s) used:")
+                    self.logger.info("RUN SUMMARY — %d tool call(s) used:", tool_call_count)
                     for entry in tools_used:
-                        self.logger.info(f"  #{entry['call']} {entry['tool']} → {entry['result']}")
-                    self.logger.info(f"FINAL ANSWER: {action.answer}")
+                        self.logger.info(
+                            "  #%d %s → %s", entry["call"], entry["tool"], entry["result"]
+                        )
+                    self.logger.info("FINAL ANSWER: %s", action.answer)
                     self.logger.info("=" * 60)
                     result = action.model_dump()
                     result["tools_used"] = tools_used
                     return result
 
             except RetryableAgentError as e:
-                self.logger.warning(f"Retryable error: {e}")
+                self.logger.warning("Retryable error: %s", e)
 
                 state.add_message(
                     role="system",
@@ -266,12 +311,58 @@ STRICT RULES
                 continue
 
             except FatalAgentError as e:
-                self.logger.error(f"Fatal error: {e}")
+                self.logger.error("Fatal error: %s", e)
                 raise
 
         self.logger.warning("Max steps reached.")
         raise FatalAgentError("Max steps exceeded")
 
+    async def arun(self, user_input: str):
+        """Async counterpart of run() for callers that live on an event loop.
+
+        Each step needs the previous tool result before the next LLM call, so a
+        single run cannot overlap its own work. All per-run state is local to
+        run(); offloading it to a worker thread lets concurrent arun() calls
+        overlap their provider waits instead of blocking the loop. At most
+        ``max_concurrent_runs`` runs execute at once.
+        """
+        async with self._run_semaphore():
+            return await asyncio.to_thread(self.run, user_input)
+
+    def _run_semaphore(self) -> asyncio.Semaphore:
+        """Return the arun() concurrency semaphore for the running event loop."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._run_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._run_semaphores.setdefault(
+                loop, asyncio.Semaphore(self.max_concurrent_runs)
+            )
+        return semaphore
+
+    def _llm_messages(self, state: AgentState, tools_used: list) -> list[AgentMessage]:
+        """Bounded view of the transcript for the next LLM call.
+
+        Keeps the system prompt and user request, replaces the omitted middle
+        with one summary of every completed tool call, then the newest
+        ``history_window`` messages. ``state.messages`` itself is not modified.
+        """
+        messages = state.messages
+        keep = self.history_window
+        if keep <= 0 or len(messages) <= 2 + keep:
+            return messages
+
+        omitted = len(messages) - 2 - keep
+        lines = [f"PROGRESS SO FAR — {omitted} earlier message(s) omitted."]
+        if tools_used:
+            lines.append(f"Completed tool calls ({len(tools_used)}):")
+            lines.extend(
+                f"  #{entry['call']} {entry['tool']} → {entry['result']}" for entry in tools_used
+            )
+        else:
+            lines.append("No tool calls have completed yet.")
+        summary: AgentMessage = {"role": "system", "content": "\n".join(lines)}
+        return [*messages[:2], summary, *messages[-keep:]]
+
     def _handle_tool(self, action: ToolAction) -> dict[str, Any]:
 
         tool = self.tools.get(action.tool_name)
@@ -284,33 +375,26 @@ STRICT RULES
 
         result = tool.execute(action.args)
 
-        self.logger.info(f"TOOL RESULT: {result}")
+        self.logger.info("TOOL RESULT: %s", result)
 
         return result
 
     def _validate_input(self, text: str) -> ToolAction | FinishAction:
 
+        # Single pass: parse + discriminate + validate in pydantic-core.
         try:
-            data = json.loads(text)
-        except json.JSONDecodeError as exc:
-            raise InvalidJSONError(
-                "Invalid JSON from model. You must return ONE JSON object only."
-            ) from exc
-
-        if "action" not in data:
-            raise MissingActionError("Missing 'action' field.")
-
-        action_type = data["action"]
-
-        try:
-            if action_type == "tool":
-                return ToolAction(**data)
-
-            elif action_type == "finish":
-                return FinishAction(**data)
-
-            else:
-                raise UnknownActionError(f"Unknown action type: {action_type}")
-
+            return _ACTION_ADAPTER.validate_json(text)
         except ValidationError as e:
+            first = e.errors()[0]
+            error_type = first["type"]
+            if error_type == "json_invalid":
+                raise InvalidJSONError(
+                    "Invalid JSON from model. You must return ONE JSON object only."
+                ) from e
+            if error_type in ("union_tag_not_found", "dict_type"):
+                raise MissingActionError("Missing 'action' field.") from e
+            if error_type == "union_tag_invalid":
+                raise UnknownActionError(
+                    f"Unknown action type: {first['ctx']['tag']}"
+                ) from e
             raise SchemaValidationError(str(e)) from e
@@ -0,0 +1,24 @@
+# http_client.py
+
+from __future__ import annotations
+
+import atexit
+from functools import lru_cache
+
+import httpx
+
+
+@lru_cache(maxsize=1)
+def shared_http_client() -> httpx.Client:
+    """Keep-alive connection pool shared by every SDK-backed LLM provider.
+
+    Both the legacy LLMProvider and the LangGraph providers pass this client to
+    their Groq/OpenAI SDK clients, so the process holds a single pool. Only the
+    pool limits live here: the client keeps httpx's default timeout, which the
+    SDKs replace with their own DEFAULT_TIMEOUT or an explicit ``timeout=``.
+    """
+    client = httpx.Client(
+        limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60.0),
+    )
+    atexit.register(client.close)
+    return client
@@ -0,0 +1,43 @@
+# json_mode.py
+
+from __future__ import annotations
+
+# Process-wide record of OpenAI-compatible endpoints (e.g. Ollama's /v1 layer)
+# that reject ``response_format={"type": "json_object"}``. Shared by the legacy
+# LLMProvider and the LangGraph OllamaChatProvider so both skip the failing
+# round-trip the same way once an endpoint has refused JSON mode.
+
+# Substrings of a 400/422 error that show the rejection is about JSON mode itself
+# rather than, say, an over-long prompt.
+_JSON_MODE_ERROR_MARKERS: tuple[str, ...] = (
+    "response_format",
+    "json mode",
+    "json_mode",
+    "json_object",
+)
+
+# (provider, base_url, model) triples whose endpoint rejected JSON mode.
+_UNSUPPORTED: set[tuple[str, str, str]] = set()
+
+
+def json_mode_supported(provider: str, base_url: str, model: str) -> bool:
+    """Return False once this endpoint/model has rejected JSON mode."""
+    return (provider, base_url, model) not in _UNSUPPORTED
+
+
+def record_json_mode_rejection(
+    exc: BaseException, provider: str, base_url: str, model: str
+) -> bool:
+    """Remember that JSON mode is unsupported if *exc* is a rejection of it.
+
+    Only a 400/422 whose message mentions response_format/JSON mode counts;
+    context-length errors, rate limits, 5xx and timeouts say nothing about JSON
+    mode support and are ignored. Returns True when the endpoint was recorded.
+    """
+    if getattr(exc, "status_code", None) not in (400, 422):
+        return False
+    detail = f"{exc} {getattr(exc, 'body', None) or ''}".lower()
+    if not any(marker in detail for marker in _JSON_MODE_ERROR_MARKERS):
+        return False
+    _UNSUPPORTED.add((provider, base_url, model))
+    return True
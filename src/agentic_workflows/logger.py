@@ -36,6 +36,25 @@ _ADMIN_PREFIXES: tuple[str, ...] = (
 _setup_done: bool = False
 
 
+class LazyTrunc:
+    """Defer slicing of a log argument until a handler actually formats it.
+
+    ``logger.info("OUT %s", LazyTrunc(text, 500))`` costs nothing when INFO is
+    disabled; the slice happens only inside ``__str__``.
+    """
+
+    __slots__ = ("_text", "_limit")
+
+    def __init__(self, text: str, limit: int) -> None:
+        self._text = text
+        self._limit = limit
+
+    def __str__(self) -> str:
+        return self._text[: self._limit]
+
+    __repr__ = __str__
+
+
 class AdminFilter(logging.Filter):
     """Pass only records whose message starts with an _ADMIN_PREFIXES entry."""
 
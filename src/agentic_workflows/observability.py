@@ -8,12 +8,15 @@ from __future__ import annotations
 
 import functools
 import os
+import threading
 from collections.abc import Callable
 from typing import Any, TypeVar
 
 F = TypeVar("F", bound=Callable[..., Any])
 
 _langfuse_client = None
+_langfuse_client_resolved = False
+_langfuse_client_lock = threading.Lock()
 _langfuse_observe = None
 _langfuse_available = False
 
@@ -36,17 +39,23 @@ def _is_configured() -> bool:
 
 
 def get_langfuse_client() -> Any | None:
-    """Return a Langfuse client if available and configured, else None."""
-    global _langfuse_client
-    if _langfuse_client is not None:
-        return _langfuse_client
-    if not _langfuse_available or not _is_configured():
-        return None
-    try:
-        _langfuse_client = Langfuse()
+    """Return a Langfuse client if available and configured, else None.
+
+    Resolved once per process, including the unavailable case, so repeated
+    flush()/score calls do not re-probe the environment.
+    """
+    global _langfuse_client, _langfuse_client_resolved
+    if _langfuse_client_resolved:
         return _langfuse_client
-    except Exception:
-        return None
+    with _langfuse_client_lock:
+        if not _langfuse_client_resolved:
+            if _langfuse_available and _is_configured():
+                try:
+                    _langfuse_client = Langfuse()
+                except Exception:
+                    _langfuse_client = None
+            _langfuse_client_resolved = True
+    return _langfuse_client
 
 
 def get_langfuse_callback_handler() -> Any | None:
@@ -76,15 +85,17 @@ def observe(name: str | None = None) -> Callable[[F], F]:
     """
     if _langfuse_available and _is_configured() and _langfuse_observe is not None:
         return _langfuse_observe(name=name)
+    return _passthrough  # type: ignore[return-value]
+
 
-    def passthrough(fn: F) -> F:
-        @functools.wraps(fn)
-        def wrapper(*args: Any, **kwargs: Any) -> Any:
-            return fn(*args, **kwargs)
+def _passthrough(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Shared no-op decorator; keeps ``__wrapped__`` like the real one."""
 
-        return wrapper  # type: ignore[return-value]
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        return fn(*args, **kwargs)
 
-    return passthrough  # type: ignore[return-value]
+    return wrapper
 
 
 def flush() -> None:
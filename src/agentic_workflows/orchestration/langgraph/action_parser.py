@@ -33,6 +33,13 @@ def validate_action(
     is ``True`` when ``parse_action_json`` used the extract-first-object fallback.
     """
     data, used_fallback = parse_action_json(model_output, step=step)
+    return _validate_action_data(data, tool_registry, used_fallback)
+
+
+def _validate_action_data(
+    data: dict[str, Any], tool_registry: dict[str, Any], used_fallback: bool
+) -> tuple[dict[str, Any], bool]:
+    """Normalize and schema-check an already-parsed action object (mutates ``data``)."""
     action_alias = str(data.get("action", "")).strip().lower()
     if (
         "tool_name" not in data
@@ -95,12 +102,30 @@ def validate_action(
     if action in {"tool", "finish"}:
         data["action"] = action
     if action == "tool":
+        # Fast path for the canonical shape; anything else gets the full
+        # ToolAction validation (and its error messages).
+        candidate_name = data.get("tool_name")
+        args = data.get("args")
+        if (
+            len(data) == 3
+            and isinstance(candidate_name, str)
+            and isinstance(args, dict)
+            and all(isinstance(key, str) for key in args)
+        ):
+            return {
+                "action": "tool",
+                "tool_name": candidate_name,
+                "args": dict(args),
+            }, used_fallback
         try:
             parsed = ToolAction(**data)
             return parsed.model_dump(), used_fallback
         except ValidationError as exc:
             raise ValueError(f"tool schema error: {str(exc)}") from exc
     if action == "finish":
+        answer = data.get("answer")
+        if len(data) == 2 and isinstance(answer, str):
+            return {"action": "finish", "answer": answer}, used_fallback
         try:
             parsed_finish = FinishAction(**data)
             return parsed_finish.model_dump(), used_fallback
@@ -254,7 +279,7 @@ def validate_action_from_dict(
     raw = dict(action_dict)
     mission_id = raw.get("__mission_id")
     sanitized = {key: value for key, value in raw.items() if not key.startswith("__")}
-    validated, used_fallback = validate_action(json.dumps(sanitized), tool_registry)
+    validated, used_fallback = _validate_action_data(sanitized, tool_registry, False)
     if isinstance(mission_id, int) and mission_id > 0:
         validated["__mission_id"] = mission_id
     return validated, used_fallback
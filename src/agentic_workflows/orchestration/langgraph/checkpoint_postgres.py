@@ -54,6 +54,38 @@ class PostgresCheckpointStore:
             return None
         return json.loads(row[0])
 
+    def append_messages(
+        self, *, run_id: str, step: int, messages: list[dict[str, Any]]
+    ) -> int:
+        """Archive messages evicted from the planner window; returns the archive row id."""
+        with self._pool.connection() as conn:
+            row = conn.execute(
+                """
+                INSERT INTO message_archive (run_id, step, messages_json, created_at)
+                VALUES (%s, %s, %s, %s)
+                RETURNING id
+                """,
+                (run_id, step, json.dumps(messages, default=str), utc_now_iso()),
+            ).fetchone()
+        return int(row[0]) if row else 0
+
+    def load_archived_messages(self, run_id: str) -> list[dict[str, Any]]:
+        """Return every archived message for a run, oldest first."""
+        with self._pool.connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT messages_json
+                FROM message_archive
+                WHERE run_id = %s
+                ORDER BY id ASC
+                """,
+                (run_id,),
+            ).fetchall()
+        archived: list[dict[str, Any]] = []
+        for r in rows:
+            archived.extend(json.loads(r[0]))
+        return archived
+
     def list_checkpoints(self, run_id: str) -> list[dict[str, Any]]:
         """Return lightweight checkpoint metadata for timeline inspection."""
         with self._pool.connection() as conn:
@@ -6,11 +6,22 @@ This store is intentionally simple (SQLite) while keeping a stable interface for
 future backend replacement (for example Postgres).
 
 Uses a persistent connection with WAL journal mode for performance (W2-3).
+Snapshots are serialized at save() time but committed in one transaction per
+graph step: rows buffer until a step-boundary node (init/plan*/finalize) saves,
+or until any read needs them.
+
+The message history and handoff lists dominate snapshot size and mostly grow by
+appends between saves, so rows store just their new tail (``list_deltas``)
+relative to the previous row of the same run.  A full snapshot is written on
+init/finalize and every ``_SNAPSHOT_INTERVAL`` saves, and a list is stored whole
+whenever it was rewritten (e.g. by context compaction).  Reads replay the deltas.
 """
 
 import json
+import operator
 import sqlite3
 import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
@@ -28,9 +39,35 @@ CREATE TABLE IF NOT EXISTS graph_checkpoints (
 
 CREATE INDEX IF NOT EXISTS ix_graph_checkpoints_run_step
 ON graph_checkpoints(run_id, step);
+
+CREATE TABLE IF NOT EXISTS message_archive (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL,
+    step INTEGER NOT NULL,
+    messages_json TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS ix_message_archive_run
+ON message_archive(run_id, id);
 """
 
 
+# Node names that close a graph step; saving one flushes the buffered rows.
+_STEP_BOUNDARY_PREFIXES: tuple[str, ...] = ("init", "plan", "finalize")
+_MAX_PENDING_ROWS = 32
+# Append-mostly list fields stored as deltas; tool_history stays whole because
+# run_audit reads the raw latest row.
+_DELTA_KEYS: tuple[str, ...] = ("messages", "handoff_queue", "handoff_results")
+_DELTA_FIELD = "list_deltas"
+# Node names that always get a full snapshot, and the max delta-chain length.
+_SNAPSHOT_PREFIXES: tuple[str, ...] = ("init", "finalize")
+_SNAPSHOT_INTERVAL = 8
+# Runs that error out or are abandoned never save a finalize row, so per-run delta
+# marks are kept in an LRU; an evicted run just writes its next save in full.
+_MAX_TRACKED_RUNS = 64
+
+
 def _json_default(x: Any) -> Any:
     """JSON serializer that handles sets (sorted list) and falls back to str."""
     if isinstance(x, set):
@@ -55,31 +92,172 @@ class SQLiteCheckpointStore:
         self._conn.execute("PRAGMA busy_timeout=5000")
         self._conn.executescript(_SCHEMA_SQL)
         self._conn.commit()
+        self._pending: list[tuple[str, int, str, str, str]] = []
+        # run_id -> {list field -> items at the last save} (references, not copies),
+        # least recently saved run first.
+        self._list_marks: OrderedDict[str, dict[str, tuple[Any, ...]]] = OrderedDict()
+        self._saves_since_snapshot: dict[str, int] = {}
 
     def save(self, *, run_id: str, step: int, node_name: str, state: RunState) -> None:
-        """Write a checkpoint snapshot for a specific node transition."""
+        """Write a checkpoint snapshot for a specific node transition.
+
+        The state is serialized immediately (callers keep mutating it); the row
+        is committed with the rest of its step on the next boundary save.
+        """
+        with self._lock:
+            row = (
+                run_id,
+                step,
+                node_name,
+                json.dumps(
+                    self._encode_deltas_locked(run_id, node_name, state),
+                    sort_keys=True,
+                    default=_json_default,
+                ),
+                utc_now_iso(),
+            )
+            self._pending.append(row)
+            if (
+                node_name.startswith(_STEP_BOUNDARY_PREFIXES)
+                or len(self._pending) >= _MAX_PENDING_ROWS
+            ):
+                self._flush_locked()
+
+    def _encode_deltas_locked(
+        self, run_id: str, node_name: str, state: RunState
+    ) -> dict[str, Any]:
+        """Replace append-only list fields with their new tail when the list allows it."""
+        if node_name.startswith("finalize"):
+            # Terminal snapshot: drop the run's marks so finished runs hold no references.
+            self._list_marks.pop(run_id, None)
+            self._saves_since_snapshot.pop(run_id, None)
+            return state  # type: ignore[return-value]
+        marks = self._list_marks.setdefault(run_id, {})
+        self._list_marks.move_to_end(run_id)
+        while len(self._list_marks) > _MAX_TRACKED_RUNS:
+            stale_run_id, _ = self._list_marks.popitem(last=False)
+            self._saves_since_snapshot.pop(stale_run_id, None)
+        since_snapshot = self._saves_since_snapshot.get(run_id, 0) + 1
+        if node_name.startswith(_SNAPSHOT_PREFIXES) or since_snapshot > _SNAPSHOT_INTERVAL:
+            since_snapshot = 0
+            marks.clear()
+        self._saves_since_snapshot[run_id] = since_snapshot
+
+        encoded: dict[str, Any] = state  # type: ignore[assignment]
+        deltas: dict[str, dict[str, Any]] = {}
+        for key in _DELTA_KEYS:
+            items = state.get(key)
+            if not isinstance(items, list):
+                marks.pop(key, None)
+                continue
+            previous = marks.get(key)
+            marks[key] = tuple(items)
+            # Every previously saved item must still be the same object at the same
+            # index; otherwise the list was rewritten (compaction, capping, a replaced
+            # message) and is stored in full.
+            if (
+                previous
+                and len(previous) <= len(items)
+                and all(map(operator.is_, previous, items))
+            ):
+                deltas[key] = {"base": len(previous), "tail": items[len(previous) :]}
+        if deltas:
+            encoded = {key: value for key, value in state.items() if key not in deltas}
+            encoded[_DELTA_FIELD] = deltas
+        return encoded
+
+    def _materialize_locked(self, run_id: str, row_id: int, state_json: str) -> RunState:
+        """Decode a checkpoint row, replaying list deltas back to their last full copy."""
+        state = json.loads(state_json)
+        deltas = state.pop(_DELTA_FIELD, None)
+        if not deltas:
+            return state
+        chains = {key: [delta] for key, delta in deltas.items()}
+        bases: dict[str, list[Any]] = {}
+        rows = self._conn.execute(
+            """
+            SELECT state_json
+            FROM graph_checkpoints
+            WHERE run_id = ? AND id < ?
+            ORDER BY id DESC
+            """,
+            (run_id, row_id),
+        )
+        for previous in rows:
+            earlier = json.loads(previous["state_json"])
+            earlier_deltas = earlier.get(_DELTA_FIELD, {})
+            for key in chains.keys() - bases.keys():
+                if key in earlier_deltas:
+                    chains[key].append(earlier_deltas[key])
+                else:
+                    bases[key] = list(earlier.get(key, []))
+            if len(bases) == len(chains):
+                break
+        for key, chain in chains.items():
+            items = bases.get(key, [])
+            for step_delta in reversed(chain):
+                del items[step_delta["base"] :]
+                items.extend(step_delta["tail"])
+            state[key] = items
+        return state
+
+    def flush(self) -> None:
+        """Commit any buffered checkpoint rows."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if not self._pending:
+            return
+        self._conn.executemany(
+            """
+            INSERT INTO graph_checkpoints (run_id, step, node_name, state_json, created_at)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            self._pending,
+        )
+        self._conn.commit()
+        self._pending.clear()
+
+    def append_messages(
+        self, *, run_id: str, step: int, messages: list[dict[str, Any]]
+    ) -> int:
+        """Archive messages evicted from the planner window; returns the archive row id."""
         with self._lock:
-            self._conn.execute(
+            cursor = self._conn.execute(
                 """
-                INSERT INTO graph_checkpoints (run_id, step, node_name, state_json, created_at)
-                VALUES (?, ?, ?, ?, ?)
+                INSERT INTO message_archive (run_id, step, messages_json, created_at)
+                VALUES (?, ?, ?, ?)
                 """,
-                (
-                    run_id,
-                    step,
-                    node_name,
-                    json.dumps(state, sort_keys=True, default=_json_default),
-                    utc_now_iso(),
-                ),
+                (run_id, step, json.dumps(messages, default=_json_default), utc_now_iso()),
             )
             self._conn.commit()
+        return int(cursor.lastrowid or 0)
+
+    def load_archived_messages(self, run_id: str) -> list[dict[str, Any]]:
+        """Return every archived message for a run, oldest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT messages_json
+                FROM message_archive
+                WHERE run_id = ?
+                ORDER BY id ASC
+                """,
+                (run_id,),
+            ).fetchall()
+        archived: list[dict[str, Any]] = []
+        for row in rows:
+            archived.extend(json.loads(row["messages_json"]))
+        return archived
 
     def load_latest(self, run_id: str) -> RunState | None:
         """Load the most recent checkpointed state for a run."""
         with self._lock:
+            self._flush_locked()
             row = self._conn.execute(
                 """
-                SELECT state_json
+                SELECT id, state_json
                 FROM graph_checkpoints
                 WHERE run_id = ?
                 ORDER BY step DESC, id DESC
@@ -87,13 +265,14 @@ class SQLiteCheckpointStore:
                 """,
                 (run_id,),
             ).fetchone()
-        if row is None:
-            return None
-        return json.loads(row["state_json"])
+            if row is None:
+                return None
+            return self._materialize_locked(run_id, row["id"], row["state_json"])
 
     def list_checkpoints(self, run_id: str) -> list[dict[str, Any]]:
         """Return lightweight checkpoint metadata for timeline inspection."""
         with self._lock:
+            self._flush_locked()
             rows = self._conn.execute(
                 """
                 SELECT step, node_name, created_at
@@ -108,6 +287,7 @@ class SQLiteCheckpointStore:
     def list_runs(self, limit: int = 10) -> list[dict[str, Any]]:
         """Query distinct run_ids ordered by most recent checkpoint."""
         with self._lock:
+            self._flush_locked()
             rows = self._conn.execute(
                 """
                 SELECT run_id, MAX(step) AS step_count, node_name, MAX(created_at) AS timestamp
@@ -123,18 +303,20 @@ class SQLiteCheckpointStore:
     def load_latest_run(self) -> RunState | None:
         """Load the final state of the most recent run (any run_id)."""
         with self._lock:
+            self._flush_locked()
             row = self._conn.execute(
                 """
-                SELECT state_json
+                SELECT id, run_id, state_json
                 FROM graph_checkpoints
                 ORDER BY id DESC
                 LIMIT 1
                 """,
             ).fetchone()
-        if row is None:
-            return None
-        return json.loads(row["state_json"])
+            if row is None:
+                return None
+            return self._materialize_locked(row["run_id"], row["id"], row["state_json"])
 
     def close(self) -> None:
-        """Close the underlying connection."""
+        """Flush buffered rows and close the underlying connection."""
+        self.flush()
         self._conn.close()
@@ -7,6 +7,9 @@ Deterministic checks that verify tool output matches mission contracts
 """
 
 import re
+import threading
+from collections import OrderedDict
+from hashlib import blake2b
 from typing import Any
 
 from agentic_workflows.orchestration.langgraph.text_extractor import (
@@ -14,6 +17,12 @@ from agentic_workflows.orchestration.langgraph.text_extractor import (
     parse_csv_int_list,
 )
 
+# Fibonacci verdicts keyed on (content digest, count): retried writes of identical
+# content skip re-parsing without the cache pinning the (possibly large) payloads.
+_FIB_CACHE_MAX_SIZE = 256
+_fib_cache: OrderedDict[tuple[bytes, int], str | None] = OrderedDict()
+_fib_cache_lock = threading.Lock()
+
 
 def validate_tool_result_for_active_mission(
     *,
@@ -46,25 +55,9 @@ def validate_tool_result_for_active_mission(
         if not isinstance(expected_count, int) or expected_count <= 0:
             expected_count = extract_fibonacci_count(mission_text)
 
-        content = str(tool_args.get("content", ""))
-        numbers = parse_csv_int_list(content)
-        if numbers is None:
-            return "write_file content must be a comma-separated list of integers."
-        if len(numbers) != expected_count:
-            return (
-                f"fibonacci content must contain exactly {expected_count} integers, "
-                f"got {len(numbers)}."
-            )
-        if len(numbers) < 2 or numbers[0] != 0 or numbers[1] != 1:
-            return "fibonacci content must start with 0, 1."
-
-        for seq_index in range(2, len(numbers)):
-            expected = numbers[seq_index - 1] + numbers[seq_index - 2]
-            if numbers[seq_index] != expected:
-                return (
-                    "fibonacci sequence mismatch at index "
-                    f"{seq_index}: got {numbers[seq_index]}, expected {expected}."
-                )
+        fib_error = validate_fibonacci_content(str(tool_args.get("content", "")), expected_count)
+        if fib_error:
+            return fib_error
 
     # Pattern report numeric consistency validation.
     should_validate_pattern_report = "pattern_report_consistency" in contract_checks
@@ -82,6 +75,49 @@ def validate_tool_result_for_active_mission(
     return None
 
 
+def validate_fibonacci_content(content: str, expected_count: int) -> str | None:
+    """Check *content* is exactly the first *expected_count* Fibonacci numbers.
+
+    Pure in its arguments, so verdicts are cached by content digest.
+    """
+    key = (blake2b(content.encode("utf-8"), digest_size=16).digest(), expected_count)
+    with _fib_cache_lock:
+        if key in _fib_cache:
+            _fib_cache.move_to_end(key)
+            return _fib_cache[key]
+    error = _check_fibonacci_content(content, expected_count)
+    with _fib_cache_lock:
+        _fib_cache[key] = error
+        if len(_fib_cache) > _FIB_CACHE_MAX_SIZE:
+            _fib_cache.popitem(last=False)
+    return error
+
+
+def _check_fibonacci_content(content: str, expected_count: int) -> str | None:
+    numbers = parse_csv_int_list(content)
+    if numbers is None:
+        return "write_file content must be a comma-separated list of integers."
+    if len(numbers) != expected_count:
+        return (
+            f"fibonacci content must contain exactly {expected_count} integers, "
+            f"got {len(numbers)}."
+        )
+    if len(numbers) < 2 or numbers[0] != 0 or numbers[1] != 1:
+        return "fibonacci content must start with 0, 1."
+
+    # Walk the canonical sequence alongside the content; the first two terms
+    # were checked above, so the expected pair starts at (0, 1).
+    prev, expected = 0, 1
+    for seq_index, value in enumerate(numbers[2:], start=2):
+        prev, expected = expected, prev + expected
+        if value != expected:
+            return (
+                "fibonacci sequence mismatch at index "
+                f"{seq_index}: got {value}, expected {expected}."
+            )
+    return None
+
+
 def validate_pattern_report_content(content: str) -> str | None:
     """Ensure pattern report contains numerically consistent sum/mean."""
     lines = [line.strip() for line in content.splitlines() if line.strip()]
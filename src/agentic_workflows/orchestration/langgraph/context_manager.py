@@ -38,6 +38,9 @@ _CASCADE_TIMEOUT_SECONDS: float = 2.0
 # When the limit is reached, the oldest half is evicted (FIFO).
 _CACHE_MAX_SIZE: int = 200
 
+# Aggressive compaction window, pinned messages included.
+_AGGRESSIVE_KEEP: int = 6
+
 
 # ── Models ───────────────────────────────────────────────────────────
 
@@ -664,23 +667,22 @@ class ContextManager:
                 summary_injected=f"[tool_result: {tool_name}, {result_len} chars]",
             )
 
-    def compact(self, state: dict[str, Any]) -> None:
+    def compact(self, state: dict[str, Any]) -> list[dict[str, Any]]:
         """Unified compaction: enforce sliding window hard cap.
 
         Replaces the old _compact_messages() and _evict_tool_result_messages().
-        Keeps system prompt (first message) + newest (cap - 1) messages.
+        Pins the system prompt and the original user request; everything after them
+        (turns, tool results, orchestrator notes) ages out oldest first, so the window
+        never exceeds the cap.
+
+        Returns the evicted messages, oldest first, so the caller can archive them.
         """
         messages: list[dict[str, Any]] = state.get("messages", [])
         if len(messages) <= self.sliding_window_cap:
-            return
+            return []
 
-        # Keep system prompt + newest (cap - 1) messages
-        system_msgs = [m for m in messages if m.get("role") == "system"]
-        non_system = [m for m in messages if m.get("role") != "system"]
-        keep_count = max(0, self.sliding_window_cap - len(system_msgs))
-        removed = len(non_system) - keep_count
-
-        state["messages"] = system_msgs + non_system[-keep_count:] if keep_count > 0 else system_msgs
+        evicted = self._evict_oldest(state, self.sliding_window_cap, min_keep=0)
+        removed = len(evicted)
 
         if removed > 0:
             self._emit_eviction_event(
@@ -703,20 +705,52 @@ class ContextManager:
                         f"of {cur['total']} lines. Continue from offset={cur['next_offset']}."
                     )
                     state["messages"].append({"role": "user", "content": hint})
+        return evicted
+
+    @staticmethod
+    def _pinned_indices(messages: list[dict[str, Any]]) -> set[int]:
+        """Indices compaction never evicts: the system prompt and the user's request.
 
-    def proactive_compact(self, state: dict[str, Any], ctx_limit: int) -> None:
+        Standing instructions live in the system prompt (prepare_state folds
+        prior-context system content into it). Every later note -- retries,
+        rejections, tool-result placeholders -- is transient and ages out.
+        """
+        pinned: set[int] = {0} if messages else set()
+        first_user = next(
+            (i for i, m in enumerate(messages) if m.get("role") == "user"), None
+        )
+        if first_user is not None:
+            pinned.add(first_user)
+        return pinned
+
+    def _evict_oldest(
+        self, state: dict[str, Any], window: int, *, min_keep: int
+    ) -> list[dict[str, Any]]:
+        """Drop the oldest unpinned messages so at most ``window`` remain; returns them."""
+        messages: list[dict[str, Any]] = state.get("messages", [])
+        pinned = self._pinned_indices(messages)
+        evictable = [i for i in range(len(messages)) if i not in pinned]
+        keep = max(min_keep, window - len(pinned))
+        dropped = set(evictable[: max(0, len(evictable) - keep)])
+        if not dropped:
+            return []
+        state["messages"] = [m for i, m in enumerate(messages) if i not in dropped]
+        return [messages[i] for i in sorted(dropped)]
+
+    def proactive_compact(self, state: dict[str, Any], ctx_limit: int) -> list[dict[str, Any]]:
         """Compact messages when estimated token count approaches ctx_limit.
 
         Called before each planner LLM call to prevent exceed_context_size_error.
         Uses len//4 token estimation (same as token_budget tracking in graph.py).
         Triggers at 80% of ctx_limit to leave headroom for the response.
+        Returns the evicted messages, oldest first.
         """
         messages = state.get("messages", [])
         estimated_tokens = sum(len(str(m.get("content", ""))) // 4 for m in messages)
         threshold = int(ctx_limit * 0.8)
 
         if estimated_tokens <= threshold:
-            return
+            return []
 
         _logger.warning(
             "PROACTIVE COMPACT triggered: estimated_tokens=%d threshold=%d ctx_limit=%d messages=%d",
@@ -724,18 +758,15 @@ class ContextManager:
         )
 
         # First try standard sliding window compaction
-        self.compact(state)
+        evicted = self.compact(state)
 
         # Re-estimate after compaction
         messages = state.get("messages", [])
         estimated_tokens_after = sum(len(str(m.get("content", ""))) // 4 for m in messages)
 
         if estimated_tokens_after > threshold:
-            # Aggressive compaction: keep system + last 5 messages
-            system_msgs = [m for m in messages if m.get("role") == "system"]
-            non_system = [m for m in messages if m.get("role") != "system"]
-            aggressive_keep = min(5, len(non_system))
-            state["messages"] = system_msgs + non_system[-aggressive_keep:]
+            # Aggressive compaction: pinned messages + newest turns, 6 messages in all
+            evicted.extend(self._evict_oldest(state, _AGGRESSIVE_KEEP, min_keep=1))
             _logger.warning(
                 "AGGRESSIVE COMPACT: reduced from %d to %d messages (estimated_tokens was %d, ctx_limit=%d)",
                 len(messages), len(state["messages"]), estimated_tokens_after, ctx_limit,
@@ -748,6 +779,7 @@ class ContextManager:
                 "CONTEXT STILL EXCEEDS LIMIT after compaction: estimated=%d limit=%d -- provider may reject",
                 final_tokens, ctx_limit,
             )
+        return evicted
 
     def build_planner_context_injection(self, state: dict[str, Any]) -> str:
         """Build a context injection string from completed mission summaries.
@@ -6,7 +6,6 @@ Deterministic action generation when the LLM provider times out or
 the token budget is exhausted. Also includes tool argument normalization.
 """
 
-import json
 from typing import Any
 
 from agentic_workflows.orchestration.langgraph.mission_tracker import (
@@ -16,6 +15,7 @@ from agentic_workflows.orchestration.langgraph.mission_tracker import (
     next_incomplete_mission_index,
     next_incomplete_mission_requirements,
 )
+from agentic_workflows.orchestration.langgraph.state_schema import tool_signature
 from agentic_workflows.orchestration.langgraph.text_extractor import (
     extract_fibonacci_count,
     extract_numbers_from_text,
@@ -28,16 +28,13 @@ from agentic_workflows.orchestration.langgraph.text_extractor import (
 def deterministic_fallback_action(state: dict[str, Any]) -> dict[str, Any] | None:
     """Build a safe tool/finish action from local state when provider times out."""
 
-    def _action_signature(action: dict[str, Any]) -> str:
-        tool_name = str(action.get("tool_name", ""))
-        args = dict(action.get("args", {}))
-        return f"{tool_name}:{json.dumps(args, sort_keys=True, default=str)}"
+    seen = state.get("seen_tool_signatures", ())
 
     def _is_duplicate_tool_action(action: dict[str, Any]) -> bool:
         if str(action.get("action", "")) != "tool":
             return False
-        seen = {str(sig) for sig in state.get("seen_tool_signatures", [])}
-        return _action_signature(action) in seen
+        signature = tool_signature(str(action.get("tool_name", "")), action.get("args", {}))
+        return signature in seen
 
     def _choose(action: dict[str, Any] | None) -> dict[str, Any] | None:
         if action is None:
@@ -169,73 +166,63 @@ def deterministic_fallback_action(state: dict[str, Any]) -> dict[str, Any] | Non
     return None
 
 
+_SEARCH_ALIASES: tuple[tuple[str, str, type | None], ...] = (
+    ("path", "directory", str),
+    ("pattern", "glob", str),
+    ("pattern", "query", str),
+)
+_OPERATION_ALIASES: tuple[tuple[str, str, type | None], ...] = (("operation", "op", str),)
+
+# tool_name -> ordered (canonical, alias, required type) renames.
+_TOOL_ARG_ALIASES: dict[str, tuple[tuple[str, str, type | None], ...]] = {
+    "sort_array": (("items", "array", list), ("items", "values", list)),
+    "repeat_message": (("message", "text", str),),
+    "string_ops": _OPERATION_ALIASES,
+    "write_file": (
+        ("path", "file_path", str),
+        ("path", "filename", str),
+        ("content", "text", str),
+        ("content", "data", str),
+    ),
+    "memoize": (("value", "data", None),),
+    "text_analysis": _OPERATION_ALIASES,
+    "data_analysis": (("numbers", "data", list), ("numbers", "values", list)),
+    "regex_matcher": (("pattern", "regex", str),),
+    "outline_code": (("path", "file_path", str),),
+    "list_directory": _SEARCH_ALIASES,
+    "search_content": _SEARCH_ALIASES,
+    "search_files": _SEARCH_ALIASES,
+    "compare_texts": (("text1", "left", str), ("text2", "right", str)),
+    "file_manager": (
+        ("source", "src", str),
+        ("destination", "dst", str),
+        ("destination", "dest", str),
+        ("operation", "op", str),
+    ),
+    "format_converter": (
+        ("from_format", "input_format", str),
+        ("to_format", "output_format", str),
+    ),
+    "encode_decode": _OPERATION_ALIASES,
+    "classify_intent": _OPERATION_ALIASES,
+    "validate_data": _OPERATION_ALIASES,
+    "retrieve_run_context": _OPERATION_ALIASES,
+}
+
+
 def normalize_tool_args(tool_name: str, args: dict[str, Any]) -> dict[str, Any]:
-    """Normalize common argument aliases before tool execution."""
-    normalized = dict(args)
-    if tool_name == "sort_array":
-        if "items" not in normalized and isinstance(normalized.get("array"), list):
-            normalized["items"] = normalized.pop("array")
-        if "items" not in normalized and isinstance(normalized.get("values"), list):
-            normalized["items"] = normalized.pop("values")
-    elif tool_name == "repeat_message":
-        if "message" not in normalized and isinstance(normalized.get("text"), str):
-            normalized["message"] = normalized.pop("text")
-    elif tool_name == "string_ops":
-        if "operation" not in normalized and isinstance(normalized.get("op"), str):
-            normalized["operation"] = normalized.pop("op")
-    elif tool_name == "write_file":
-        if "path" not in normalized and isinstance(normalized.get("file_path"), str):
-            normalized["path"] = normalized.pop("file_path")
-        if "path" not in normalized and isinstance(normalized.get("filename"), str):
-            normalized["path"] = normalized.pop("filename")
-        if "content" not in normalized and isinstance(normalized.get("text"), str):
-            normalized["content"] = normalized.pop("text")
-        if "content" not in normalized and isinstance(normalized.get("data"), str):
-            normalized["content"] = normalized.pop("data")
-    elif tool_name == "memoize":
-        if "value" not in normalized and "data" in normalized:
-            normalized["value"] = normalized.pop("data")
-    elif tool_name == "text_analysis":
-        if "operation" not in normalized and isinstance(normalized.get("op"), str):
-            normalized["operation"] = normalized.pop("op")
-    elif tool_name == "data_analysis":
-        if "numbers" not in normalized and isinstance(normalized.get("data"), list):
-            normalized["numbers"] = normalized.pop("data")
-        if "numbers" not in normalized and isinstance(normalized.get("values"), list):
-            normalized["numbers"] = normalized.pop("values")
-    elif tool_name == "regex_matcher":
-        if "pattern" not in normalized and isinstance(normalized.get("regex"), str):
-            normalized["pattern"] = normalized.pop("regex")
-    elif tool_name == "outline_code":
-        if "path" not in normalized and isinstance(normalized.get("file_path"), str):
-            normalized["path"] = normalized.pop("file_path")
-    elif tool_name in ("list_directory", "search_content", "search_files"):
-        if "path" not in normalized and isinstance(normalized.get("directory"), str):
-            normalized["path"] = normalized.pop("directory")
-        if "pattern" not in normalized and isinstance(normalized.get("glob"), str):
-            normalized["pattern"] = normalized.pop("glob")
-        if "pattern" not in normalized and isinstance(normalized.get("query"), str):
-            normalized["pattern"] = normalized.pop("query")
-    elif tool_name == "compare_texts":
-        if "text1" not in normalized and isinstance(normalized.get("left"), str):
-            normalized["text1"] = normalized.pop("left")
-        if "text2" not in normalized and isinstance(normalized.get("right"), str):
-            normalized["text2"] = normalized.pop("right")
-    elif tool_name == "file_manager":
-        if "source" not in normalized and isinstance(normalized.get("src"), str):
-            normalized["source"] = normalized.pop("src")
-        if "destination" not in normalized and isinstance(normalized.get("dst"), str):
-            normalized["destination"] = normalized.pop("dst")
-        if "destination" not in normalized and isinstance(normalized.get("dest"), str):
-            normalized["destination"] = normalized.pop("dest")
-        if "operation" not in normalized and isinstance(normalized.get("op"), str):
-            normalized["operation"] = normalized.pop("op")
-    elif tool_name == "format_converter":
-        if "from_format" not in normalized and isinstance(normalized.get("input_format"), str):
-            normalized["from_format"] = normalized.pop("input_format")
-        if "to_format" not in normalized and isinstance(normalized.get("output_format"), str):
-            normalized["to_format"] = normalized.pop("output_format")
-    elif tool_name in ("encode_decode", "classify_intent", "validate_data", "retrieve_run_context"):
-        if "operation" not in normalized and isinstance(normalized.get("op"), str):
-            normalized["operation"] = normalized.pop("op")
+    """Normalize common argument aliases before tool execution.
+
+    The input dict is never mutated. It is returned as-is when no alias applies;
+    a copy is made only on the first rename.
+    """
+    normalized = args
+    for target, source, kind in _TOOL_ARG_ALIASES.get(tool_name, ()):
+        if target in normalized or source not in normalized:
+            continue
+        if kind is not None and not isinstance(normalized[source], kind):
+            continue
+        if normalized is args:
+            normalized = dict(args)
+        normalized[target] = normalized.pop(source)
     return normalized
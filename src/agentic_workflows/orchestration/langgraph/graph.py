@@ -7,15 +7,19 @@ executes deterministic tools, enforces memoization policy, and produces
 run/mission reports using only local state for final snapshots.
 """
 
+import asyncio
 import contextlib
 import contextvars
-import json
+import logging
 import operator
 import os
 import queue
 import re
 import threading
 import typing
+import weakref
+from collections import OrderedDict
+from hashlib import blake2b
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
 
@@ -24,7 +28,7 @@ if TYPE_CHECKING:
     from agentic_workflows.storage.artifact_store import ArtifactStore
     from agentic_workflows.storage.mission_context_store import MissionContextStore
 
-from agentic_workflows.logger import get_logger
+from agentic_workflows.logger import LazyTrunc, get_logger
 from agentic_workflows.observability import (
     get_langfuse_callback_handler,
     observe,
@@ -68,8 +72,11 @@ from agentic_workflows.orchestration.langgraph.state_schema import (
     MemoEvent,
     RunResult,
     RunState,
+    ToolRecord,
+    compact_json,
     ensure_state_defaults,
     new_run_state,
+    tool_signature,
     utc_now_iso,
 )
 from agentic_workflows.orchestration.langgraph.tools_registry import build_tool_registry
@@ -131,6 +138,25 @@ _PIPELINE_TRACE_CAP: int = 500
 _HANDOFF_QUEUE_CAP: int = 50
 _HANDOFF_RESULTS_CAP: int = 50
 
+# Provider errors where retrying the same prompt is pointless; "model" and
+# "not found" must co-occur (either order). One case-insensitive pass.
+_UNRECOVERABLE_PLAN_ERROR_RE = re.compile(
+    r"model.*not found|not found.*model|invalid api key|authentication|permission"
+    r"|insufficient_quota|rate limit exceeded",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Invariant orchestrator note texts. Only the strings are shared: each append builds
+# a fresh message dict, since messages are mutable state (prepare_state, compaction
+# and tool-result placeholders rewrite them) and must never alias across runs.
+_TIMEOUT_FALLBACK_NOTE = (
+    "Provider timeout during planning. Orchestrator selected a deterministic fallback action."
+)
+_MEMO_HIT_SKIP_NOTE = (
+    "Memo hit found for this deterministic write. "
+    "Skip recomputation and continue with remaining tasks."
+)
+
 # W1-2: Per-run callback isolation via ContextVar.
 # Each run()/streaming call sets its own callback list; concurrent runs in
 # different threads each see their own value (ContextVar provides this
@@ -236,7 +262,6 @@ class LangGraphOrchestrator:
     ) -> None:
         self.provider = provider or build_provider()
         self._fallback_provider = fallback_provider
-        self._consecutive_parse_failures = 0
         try:
             _ctx_size = self.provider.context_size()
         except AttributeError:
@@ -282,12 +307,28 @@ class LangGraphOrchestrator:
             artifact_store=artifact_store,
         )
         self.strict_single_action_mode = self._env_bool("P1_STRICT_SINGLE_ACTION", False)
+        self.fused_step_mode = self._env_bool("P1_FUSED_STEP", False)
+        # Caps how many arun() graphs execute at once; extra callers wait their turn.
+        # Clamped to >= 1: a zero/fractional cap would block every arun() forever.
+        self.max_concurrent_runs = max(1, int(self._env_float("P1_MAX_CONCURRENT_RUNS", 4.0)))
+        # asyncio primitives bind to the loop that first waits on them, so arun() keeps
+        # one semaphore per running loop (see _run_semaphore) instead of one per instance.
+        self._run_semaphores: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+        # Opt-in LRU of planner outputs keyed by (provider, messages); 0 disables it.
+        self.plan_cache_size = int(self._env_float("P1_PLAN_CACHE_SIZE", 0.0))
+        self._plan_cache: OrderedDict[str, str] = OrderedDict()
+        self._plan_cache_lock = threading.Lock()
         self.tools: dict[str, Tool] = build_tool_registry(
             self.memo_store,
             checkpoint_store=self.checkpoint_store,
             mission_context_store=mission_context_store,
             embedding_provider=embedding_provider,
         )
+        # The registry is fixed after init; precompute the views used on hot paths.
+        self._tool_name_set: frozenset[str] = frozenset(self.tools)
+        self._tool_names_joined: str = ", ".join(self.tools)
         self._action_json_schema: dict = self._build_action_json_schema()
         self._executor_subgraph = build_executor_subgraph(memo_store=self.memo_store)
         self._evaluator_subgraph = build_evaluator_subgraph()
@@ -429,7 +470,7 @@ class LangGraphOrchestrator:
             )
 
         # Full tier: prepend env_block to existing prompt
-        tool_list = ", ".join(self.tools.keys())
+        tool_list = self._tool_names_joined
         codebase_ctx = self._build_codebase_context(readable_root)
         workspace_line = (
             f"Project root (read): {readable_root}\nWrite workspace: {writable_root}\n"
@@ -591,7 +632,7 @@ class LangGraphOrchestrator:
             for tc in tool_calls or []:
                 tool_name = tc.get("name", "") if isinstance(tc, dict) else getattr(tc, "name", "")
                 tool_args = tc.get("args", {}) if isinstance(tc, dict) else getattr(tc, "args", {})
-                signature = f"{tool_name}:{json.dumps(tool_args, sort_keys=True, default=str)}"
+                signature = tool_signature(tool_name, tool_args)
                 if signature in state.get("seen_tool_signatures", set()):
                     self.logger.info(
                         "TOOL_NODE DEDUP BLOCK tool=%s signature=%s",
@@ -617,7 +658,8 @@ class LangGraphOrchestrator:
         for that provider only.
 
         All other provider paths (ollama, openai, groq, scripted) use the existing
-        ChatProvider pattern unchanged.
+        ChatProvider pattern unchanged. With P1_FUSED_STEP=1 those paths collapse
+        plan/execute/policy into the single "plan" node (see _fused_step).
         """
         if StateGraph is None:
             raise RuntimeError(
@@ -629,10 +671,17 @@ class LangGraphOrchestrator:
             and os.getenv("P1_PROVIDER", "ollama").lower() == "anthropic"
         )
 
+        # P1_FUSED_STEP: run plan -> execute -> policy inside the single "plan" node,
+        # saving two graph hops (and their state reducer passes) per step.
+        fused = self.fused_step_mode and not use_tool_node
+
         builder = StateGraph(RunState)
-        builder.add_node("plan", _sequential_node(self._plan_next_action))
-        builder.add_node("execute", _sequential_node(self._route_to_specialist))
-        builder.add_node("policy", _sequential_node(self._enforce_memo_policy))
+        builder.add_node(
+            "plan", _sequential_node(self._fused_step if fused else self._plan_next_action)
+        )
+        if not fused:
+            builder.add_node("execute", _sequential_node(self._route_to_specialist))
+            builder.add_node("policy", _sequential_node(self._enforce_memo_policy))
         builder.add_node("finalize", _sequential_node(self._finalize))
         builder.add_edge(START, "plan")
         builder.add_edge("finalize", END)
@@ -660,6 +709,16 @@ class LangGraphOrchestrator:
                 "TOOLNODE WIRED provider=anthropic tools=%s handle_tool_errors=True",
                 [t.name for t in lc_tools],
             )
+        elif fused:
+            # Fused path: plan(+execute+policy) → plan loop. A tool action left
+            # pending after the fused step is re-planned, matching policy → plan.
+            builder.add_node("clarify", self._clarify_node)
+            builder.add_conditional_edges(
+                "plan",
+                self._route_after_plan,
+                {"plan": "plan", "execute": "plan", "finish": "finalize", "clarify": "clarify"},
+            )
+            builder.add_edge("clarify", "finalize")
         else:
             # Standard path: plan → execute → policy → plan loop.
             builder.add_node("clarify", self._clarify_node)
@@ -770,6 +829,54 @@ class LangGraphOrchestrator:
             state,
             config={"recursion_limit": self.max_steps * 9, "callbacks": _active_callbacks_var.get([])},
         )
+        return self._build_run_result(final_state)
+
+    @observe("langgraph.orchestrator.arun")
+    async def arun(
+        self,
+        user_input: str,
+        run_id: str | None = None,
+        *,
+        rerun_context: dict[str, Any] | None = None,
+        prior_context: list[AgentMessage] | None = None,
+    ) -> RunResult:
+        """Async counterpart of run() for serving many runs from one event loop.
+
+        Graph nodes stay synchronous; ``ainvoke`` dispatches them to worker threads,
+        so concurrent arun() calls overlap their provider waits instead of queueing
+        behind one another. At most ``max_concurrent_runs`` graphs execute at once.
+        """
+        async with self._run_semaphore():
+            _handler = get_langfuse_callback_handler()
+            _active_callbacks_var.set([_handler] if _handler else [])
+            state = await asyncio.to_thread(
+                self.prepare_state,
+                user_input,
+                run_id=run_id,
+                prior_context=prior_context,
+                rerun_context=rerun_context,
+            )
+            final_state = await self._compiled.ainvoke(
+                state,
+                config={
+                    "recursion_limit": self.max_steps * 9,
+                    "callbacks": _active_callbacks_var.get([]),
+                },
+            )
+            return await asyncio.to_thread(self._build_run_result, final_state)
+
+    def _run_semaphore(self) -> asyncio.Semaphore:
+        """Return the arun() concurrency semaphore for the running event loop."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._run_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._run_semaphores.setdefault(
+                loop, asyncio.Semaphore(self.max_concurrent_runs)
+            )
+        return semaphore
+
+    def _build_run_result(self, final_state: RunState) -> RunResult:
+        """Assemble the RunResult returned by run()/arun() from the final graph state."""
         final_state = ensure_state_defaults(final_state, system_prompt=self.system_prompt)
         memo_entries = self.memo_store.list_entries(run_id=final_state["run_id"])
         derived_snapshot = self._build_derived_snapshot(final_state, memo_entries)
@@ -812,6 +919,18 @@ class LangGraphOrchestrator:
             return "clarify"
         return "execute"
 
+    def _fused_step(self, state: RunState) -> RunState:
+        """Plan, then execute and apply memo policy in one node when a tool was chosen.
+
+        Semantically identical to the plan -> execute -> policy edge sequence; only
+        used when P1_FUSED_STEP is enabled.
+        """
+        state = self._plan_next_action(state)
+        if self._route_after_plan(state) != "execute":
+            return state
+        state = self._route_to_specialist(state)
+        return self._enforce_memo_policy(state)
+
     def _clarify_node(self, state: RunState) -> RunState:
         """Handle clarify action: surface the question as the final answer."""
         action = state.get("pending_action") or {}
@@ -859,16 +978,17 @@ class LangGraphOrchestrator:
 
     def _planner_action_preview(self, action: dict[str, Any]) -> dict[str, Any]:
         """Return a compact planner action preview for logs."""
-        args = dict(action.get("args", {}))
         return {
             "action": str(action.get("action", "")),
             "tool_name": str(action.get("tool_name", "")),
             "__mission_id": int(action.get("__mission_id", 0) or 0),
-            "arg_keys": sorted(args.keys()),
+            "arg_keys": sorted(action.get("args") or {}),
         }
 
-    def _log_parser_state(self, state: RunState) -> None:
-        """Emit parser state snapshot for the current planner step."""
+    def _log_planner_step_start(self, state: RunState) -> None:
+        """Emit one combined step-start record (loop flags + parser state) per planner step."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         structured = state.get("structured_plan")
         method = "unknown"
         step_count = 0
@@ -877,13 +997,17 @@ class LangGraphOrchestrator:
             step_count = len(structured.get("steps", []))
         next_mission = self._next_incomplete_mission(state)
         next_preview = next_mission[:120] + "..." if len(next_mission) > 120 else next_mission
+        policy_flags = state.get("policy_flags", {})
         self.logger.info(
             (
-                "PARSER STATE step=%s run_id=%s method=%s parsed_steps=%s missions=%s "
-                "next_mission=%s"
+                "PLANNER STEP START step=%s run_id=%s queue=%s timeout_mode=%s "
+                "memo_required=%s method=%s parsed_steps=%s missions=%s next_mission=%s"
             ),
             state["step"],
             state["run_id"],
+            len(state.get("pending_action_queue", [])),
+            bool(policy_flags.get("planner_timeout_mode", False)),
+            bool(policy_flags.get("memo_required", False)),
             method,
             step_count,
             len(state.get("missions", [])),
@@ -894,6 +1018,8 @@ class LangGraphOrchestrator:
         self, *, state: RunState, source: str, action: dict[str, Any], queue_remaining: int
     ) -> None:
         """Emit normalized planner output per step, regardless of source."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         self.logger.info(
             "PLANNER OUTPUT step=%s source=%s queue_remaining=%s action=%s",
             state["step"],
@@ -905,29 +1031,19 @@ class LangGraphOrchestrator:
     def _plan_next_action(self, state: RunState) -> RunState:
         """Call the model planner and parse one strict JSON action."""
         state = ensure_state_defaults(state, system_prompt=self.system_prompt)
-        self.context_manager.compact(state)
+        evicted = self.context_manager.compact(state)
         # Proactive compaction against provider context limit
         try:
             ctx_limit = self.provider.context_size()
-            self.context_manager.proactive_compact(state, ctx_limit)
+            evicted += self.context_manager.proactive_compact(state, ctx_limit)
         except Exception:  # noqa: BLE001
             pass  # graceful degradation -- don't crash if proactive compact fails
+        self._archive_evicted_messages(state, evicted)
         pending_action = state.get("pending_action") or {}
         if pending_action.get("action") == "finish":
             return state
         state["step"] = state.get("step", 0) + 1
-        self.logger.info(
-            (
-                "PLANNER STEP START step=%s run_id=%s queue=%s timeout_mode=%s "
-                "memo_required=%s"
-            ),
-            state["step"],
-            state["run_id"],
-            len(state.get("pending_action_queue", [])),
-            bool(state.get("policy_flags", {}).get("planner_timeout_mode", False)),
-            bool(state.get("policy_flags", {}).get("memo_required", False)),
-        )
-        self._log_parser_state(state)
+        self._log_planner_step_start(state)
         self._emit_trace(state, "loop_state",
             step=state["step"],
             queue_depth=len(state.get("pending_action_queue", [])),
@@ -1074,7 +1190,7 @@ class LangGraphOrchestrator:
         if (
             state["step"] == 1
             and self._mission_context_store is not None
-            and "query_context" in self.tools
+            and "query_context" in self._tool_name_set
             and "[Cross-run]" not in (context_injection or "")
         ):
             try:
@@ -1135,7 +1251,9 @@ class LangGraphOrchestrator:
                 state["messages"],
                 signals=_signals,
             ).strip()
-            self.logger.info("MODEL OUTPUT step=%s output=%s", state["step"], model_output[:500])
+            self.logger.info(
+                "MODEL OUTPUT step=%s output=%s", state["step"], LazyTrunc(model_output, 500)
+            )
             _api_logger.info(
                 "PLANNER_STEP step=%s model=%s provider=%s tier=%s "
                 "routing_signals=%s tokens_est=%d output_preview=%s",
@@ -1145,7 +1263,7 @@ class LangGraphOrchestrator:
                 _tier,
                 _signals,
                 len(model_output) // 4,
-                model_output[:200],
+                LazyTrunc(model_output, 200),
             )
 
             # Treat a bare "{}" as semantically empty — the GBNF grammar allows
@@ -1183,7 +1301,7 @@ class LangGraphOrchestrator:
                         state["step"],
                         fallback["action"],
                     )
-                    state["messages"].append({"role": "assistant", "content": json.dumps(fallback)})
+                    state["messages"].append({"role": "assistant", "content": compact_json(fallback)})
                     state["pending_action"] = fallback
                     self.checkpoint_store.save(
                         run_id=state["run_id"],
@@ -1272,13 +1390,13 @@ class LangGraphOrchestrator:
                             basename = path.replace("\\", "/").rsplit("/", 1)[-1]
                             preview_entry["written_files"].add(basename)
                 tagged_actions.append(action_with_meta)
-            previews = [self._planner_action_preview(a) for a in tagged_actions[:5]]
-            self.logger.info(
-                "PLANNER PARSED OUTPUT step=%s actions=%s previews=%s",
-                state["step"],
-                len(tagged_actions),
-                previews,
-            )
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    "PLANNER PARSED OUTPUT step=%s actions=%s previews=%s",
+                    state["step"],
+                    len(tagged_actions),
+                    [self._planner_action_preview(a) for a in tagged_actions[:5]],
+                )
 
             action, _validate_used_fallback = self._validate_action_from_dict(tagged_actions[0])
             if _validate_used_fallback:
@@ -1329,15 +1447,19 @@ class LangGraphOrchestrator:
                     return state
                 else:
                     # drift_count >= 3: Accept and continue (already have valid parsed action)
-                    self._consecutive_parse_failures += 1
+                    # Per-run counter: one orchestrator may serve concurrent arun() calls.
+                    parse_failures = (
+                        int(state["retry_counts"].get("consecutive_parse_failures", 0)) + 1
+                    )
+                    state["retry_counts"]["consecutive_parse_failures"] = parse_failures
                     self.logger.warning(
                         "FORMAT DRIFT ACCEPTED step=%s drift_count=%s consecutive_parse_failures=%s",
                         state["step"],
                         drift_count,
-                        self._consecutive_parse_failures,
+                        parse_failures,
                     )
                     # Cloud fallback on 2+ consecutive parse failures
-                    if self._consecutive_parse_failures >= 2 and self._fallback_provider is not None:
+                    if parse_failures >= 2 and self._fallback_provider is not None:
                         try:
                             self.logger.info(
                                 "CLOUD FALLBACK ATTEMPT step=%s reason=parse_failures",
@@ -1353,7 +1475,7 @@ class LangGraphOrchestrator:
                             state["structural_health"]["local_model_failures"]["parse"] = (
                                 state["structural_health"]["local_model_failures"].get("parse", 0) + 1
                             )
-                            self._consecutive_parse_failures = 0
+                            state["retry_counts"]["consecutive_parse_failures"] = 0
                             if cloud_output and cloud_output != "{}":
                                 cloud_actions, _ = self._parse_all_actions_json(cloud_output)
                                 if cloud_actions:
@@ -1367,7 +1489,7 @@ class LangGraphOrchestrator:
                             )
             else:
                 # Reset on clean parse
-                self._consecutive_parse_failures = 0
+                state["retry_counts"]["consecutive_parse_failures"] = 0
                 state["retry_counts"]["consecutive_format_drift"] = 0
 
             if len(all_actions) > 1:
@@ -1461,7 +1583,7 @@ class LangGraphOrchestrator:
                     self.logger.info(
                         "CLOUD FALLBACK SUCCESS step=%s output=%s",
                         state["step"],
-                        model_output[:200],
+                        LazyTrunc(model_output, 200),
                     )
                     # Feed cloud output into normal parsing path
                     if model_output and model_output != "{}":
@@ -1511,14 +1633,7 @@ class LangGraphOrchestrator:
                     action=fallback_action,
                     queue_remaining=0,
                 )
-                state["messages"].append(
-                    {
-                        "role": "system",
-                        "content": (
-                            "Provider timeout during planning. Orchestrator selected a deterministic fallback action."
-                        ),
-                    }
-                )
+                state["messages"].append({"role": "system", "content": _TIMEOUT_FALLBACK_NOTE})
                 state["policy_flags"]["planner_timeout_mode"] = True
                 state["pending_action_queue"] = []
                 state["pending_action"] = fallback_action
@@ -1569,7 +1684,12 @@ class LangGraphOrchestrator:
                     state["step"],
                 )
                 try:
-                    self.context_manager.proactive_compact(state, self.provider.context_size())
+                    self._archive_evicted_messages(
+                        state,
+                        self.context_manager.proactive_compact(
+                            state, self.provider.context_size()
+                        ),
+                    )
                     model_output = self._generate_with_hard_timeout(
                         state["messages"], signals=_signals,
                     ).strip()
@@ -1725,6 +1845,19 @@ class LangGraphOrchestrator:
             )
             return state
 
+    def _archive_evicted_messages(
+        self, state: RunState, evicted: list[dict[str, Any]]
+    ) -> None:
+        """Persist messages dropped from the planner window so checkpoints stay bounded."""
+        if not evicted:
+            return
+        try:
+            self.checkpoint_store.append_messages(
+                run_id=state["run_id"], step=state["step"], messages=evicted
+            )
+        except Exception as exc:  # noqa: BLE001
+            self.logger.warning("MESSAGE ARCHIVE FAILED run_id=%s error=%s", state["run_id"], exc)
+
     def _env_float(self, name: str, default: float) -> float:
         raw = (os.getenv(name) or "").strip()
         if not raw:
@@ -1845,12 +1978,13 @@ class LangGraphOrchestrator:
             f"{','.join(str(item) for item in missing_files)}|"
             f"{self._planner_action_preview(rejected_action)}"
         )
-        last_fingerprint = str(state["policy_flags"].get("last_finish_rejection_fingerprint", ""))
+        flags = state["policy_flags"]
+        last_fingerprint = str(flags.get("last_finish_rejection_fingerprint", ""))
         streak = 1 if fingerprint != last_fingerprint else int(
-            state["policy_flags"].get("finish_rejection_streak", 0)
+            flags.get("finish_rejection_streak", 0)
         ) + 1
-        state["policy_flags"]["last_finish_rejection_fingerprint"] = fingerprint
-        state["policy_flags"]["finish_rejection_streak"] = streak
+        flags["last_finish_rejection_fingerprint"] = fingerprint
+        flags["finish_rejection_streak"] = streak
 
         self.logger.warning(
             (
@@ -1935,9 +2069,44 @@ class LangGraphOrchestrator:
         messages: list[dict[str, str]],
         signals: RoutingSignals,
     ) -> str:
-        """Protect planner generate() call with a hard wall-clock timeout."""
-        timeout_seconds = self.plan_call_timeout_seconds
+        """Protect planner generate() call with a hard wall-clock timeout.
+
+        With ``P1_PLAN_CACHE_SIZE`` > 0, a repeated (provider, messages) input
+        reuses the earlier output instead of calling the provider again.
+        """
         provider = self._router.route_by_signals(signals)
+        if self.plan_cache_size <= 0:
+            return self._call_planner_provider(provider, messages)
+
+        # Keyed on the provider's configuration, not id(provider): ids are reused
+        # after garbage collection, which could hand a new provider a stale plan.
+        provider_identity = (
+            f"{type(provider).__name__}|{getattr(provider, 'model', '')}"
+            f"|{getattr(provider, 'base_url', '')}"
+        )
+        cache_key = blake2b(
+            f"{provider_identity}:{compact_json(messages)}".encode(), digest_size=16
+        ).hexdigest()
+        with self._plan_cache_lock:
+            cached = self._plan_cache.get(cache_key)
+            if cached is not None:
+                self._plan_cache.move_to_end(cache_key)
+                self.logger.info("PLAN CACHE HIT key=%s", cache_key)
+                return cached
+        output = self._call_planner_provider(provider, messages)
+        if output.strip():
+            with self._plan_cache_lock:
+                self._plan_cache[cache_key] = output
+                if len(self._plan_cache) > self.plan_cache_size:
+                    self._plan_cache.popitem(last=False)
+        return output
+
+    def _call_planner_provider(
+        self,
+        provider: ChatProvider,
+        messages: list[dict[str, str]],
+    ) -> str:
+        timeout_seconds = self.plan_call_timeout_seconds
         if timeout_seconds <= 0:
             return provider.generate(messages, response_schema=self._action_json_schema)
 
@@ -2032,7 +2201,8 @@ class LangGraphOrchestrator:
                 tool_scope=tool_scope,
                 input_context={
                     "tool_name": tool_name,
-                    "args": dict(action.get("args", {})),
+                    # model_dump() below copies; no need to pre-copy the args.
+                    "args": action.get("args") or {},
                     "step": state["step"],
                 },
                 token_budget=int(state.get("token_budget_remaining", 0)),
@@ -2091,7 +2261,12 @@ class LangGraphOrchestrator:
         return state
 
     def _execute_action(self, state: RunState) -> RunState:
-        """Execute planned tool action, including duplicate and policy checks."""
+        """Execute planned tool action, including duplicate and policy checks.
+
+        Rejection branches that only touch transient fields (messages,
+        pending_action, retry counters) return without a checkpoint; the next
+        plan or finalize checkpoint captures their state.
+        """
         state = ensure_state_defaults(state, system_prompt=self.system_prompt)
         action = state.get("pending_action")
         if not action:
@@ -2100,12 +2275,14 @@ class LangGraphOrchestrator:
         if action.get("action") == "finish":
             state["final_answer"] = str(action.get("answer", ""))
             self.logger.info(
-                "FINISH ACTION step=%s answer=%s", state["step"], state["final_answer"][:300]
+                "FINISH ACTION step=%s answer=%s",
+                state["step"],
+                LazyTrunc(state["final_answer"], 300),
             )
             return state
 
         tool_name = str(action.get("tool_name", ""))
-        tool_args = self._normalize_tool_args(tool_name, dict(action.get("args", {})))
+        tool_args = self._normalize_tool_args(tool_name, action.get("args", {}))
         specialist = str(state.get("active_specialist", "executor")).strip() or "executor"
         if not self._is_tool_allowed_for_specialist(specialist=specialist, tool_name=tool_name):
             config = directives.DIRECTIVE_BY_SPECIALIST.get(specialist)  # type: ignore[arg-type]
@@ -2131,12 +2308,6 @@ class LangGraphOrchestrator:
                 }
             )
             state["pending_action"] = None
-            self.checkpoint_store.save(
-                run_id=state["run_id"],
-                step=state["step"],
-                node_name="execute_scope_violation",
-                state=state,
-            )
             return state
         mission_id = action.get("__mission_id")
         mission_index = -1
@@ -2197,15 +2368,7 @@ class LangGraphOrchestrator:
                         self._mark_next_mission_complete_from_memo_hit(
                             state=state, memo_hit=memo_hit
                         )
-                    state["messages"].append(
-                        {
-                            "role": "system",
-                            "content": (
-                                "Memo hit found for this deterministic write. "
-                                "Skip recomputation and continue with remaining tasks."
-                            ),
-                        }
-                    )
+                    state["messages"].append({"role": "system", "content": _MEMO_HIT_SKIP_NOTE})
                     state["pending_action"] = None
                     self.checkpoint_store.save(
                         run_id=state["run_id"],
@@ -2215,7 +2378,8 @@ class LangGraphOrchestrator:
                     )
                     return state
 
-        if state["policy_flags"].get("memo_required") and tool_name != "memoize":
+        flags = state["policy_flags"]
+        if flags.get("memo_required") and tool_name != "memoize":
             retry_count = int(state["retry_counts"].get("memo_policy", 0)) + 1
             state["retry_counts"]["memo_policy"] = retry_count
             self.logger.info(
@@ -2229,8 +2393,8 @@ class LangGraphOrchestrator:
                     "Memoization required but model repeatedly skipped it."
                 )
 
-            required_key = str(state["policy_flags"].get("memo_required_key", ""))
-            reason = str(state["policy_flags"].get("memo_required_reason", ""))
+            required_key = str(flags.get("memo_required_key", ""))
+            reason = str(flags.get("memo_required_reason", ""))
             state["messages"].append(
                 {
                     "role": "system",
@@ -2241,36 +2405,27 @@ class LangGraphOrchestrator:
                 }
             )
             state["pending_action"] = None
-            self.checkpoint_store.save(
-                run_id=state["run_id"],
-                step=state["step"],
-                node_name="execute_policy_retry",
-                state=state,
-            )
             return state
 
-        if tool_name not in self.tools:
+        if tool_name not in self._tool_name_set:
             state["messages"].append(
                 {
                     "role": "system",
-                    "content": f"Unknown tool '{tool_name}'. Use one of: {', '.join(self.tools.keys())}.",
+                    "content": f"Unknown tool '{tool_name}'. Use one of: {self._tool_names_joined}.",
                 }
             )
             state["pending_action"] = None
-            self.checkpoint_store.save(
-                run_id=state["run_id"],
-                step=state["step"],
-                node_name="execute_unknown_tool",
-                state=state,
-            )
             return state
 
         if tool_name in {"memoize", "retrieve_memo"}:
+            # Only these tools get injected defaults; copy so the planner's action
+            # args are never mutated in place.
+            tool_args = dict(tool_args)
             tool_args.setdefault("run_id", state["run_id"])
         if tool_name == "memoize":
             tool_args.setdefault("step", state["step"])
 
-        signature = f"{tool_name}:{json.dumps(tool_args, sort_keys=True, default=str)}"
+        signature = tool_signature(tool_name, tool_args)
         # Cursor-resumption actions bypass duplicate detection (narrowly scoped to read_file_chunk)
         _is_cursor_resume = (
             action.get("__cursor_resume") is True
@@ -2285,12 +2440,6 @@ class LangGraphOrchestrator:
                     "action": "finish",
                     "answer": self._build_auto_finish_answer(state),
                 }
-                self.checkpoint_store.save(
-                    run_id=state["run_id"],
-                    step=state["step"],
-                    node_name="execute_duplicate_finish",
-                    state=state,
-                )
                 return state
             if duplicate_retry_count > self.max_duplicate_tool_retries:
                 fail_message = (
@@ -2299,12 +2448,6 @@ class LangGraphOrchestrator:
                 )
                 state["messages"].append({"role": "system", "content": fail_message})
                 state["pending_action"] = {"action": "finish", "answer": fail_message}
-                self.checkpoint_store.save(
-                    run_id=state["run_id"],
-                    step=state["step"],
-                    node_name="execute_duplicate_fail_closed",
-                    state=state,
-                )
                 return state
             guidance = (
                 f"Next incomplete task: {next_mission}."
@@ -2321,12 +2464,6 @@ class LangGraphOrchestrator:
                 }
             )
             state["pending_action"] = None
-            self.checkpoint_store.save(
-                run_id=state["run_id"],
-                step=state["step"],
-                node_name="execute_duplicate_tool",
-                state=state,
-            )
             return state
         state["seen_tool_signatures"].add(signature)
 
@@ -2385,15 +2522,16 @@ class LangGraphOrchestrator:
                 reason=validation_error[:120],
                 retry_count=retry_count,
             )
-        state["tool_call_counts"][tool_name] = int(state["tool_call_counts"].get(tool_name, 0)) + 1
+        call_counts = state["tool_call_counts"]
+        call_counts[tool_name] = call_counts.get(tool_name, 0) + 1
         call_number = len(state["tool_history"]) + 1
         state["tool_history"].append(
-            {
-                "call": call_number,
-                "tool": tool_name,
-                "args": tool_args,
-                "result": tool_result,
-            }
+            ToolRecord(
+                call=call_number,
+                tool=tool_name,
+                args=tool_args,
+                result=tool_result,
+            )
         )
         _pre_statuses = {
             int(r.get("mission_id", i + 1)): str(r.get("status", ""))
@@ -2455,7 +2593,7 @@ class LangGraphOrchestrator:
         # Gate: truncate large tool results BEFORE they enter state["messages"].
         # This prevents context overflow on the next planner call.
         # on_tool_result() below still receives the full result for artifact extraction.
-        _tool_result_json = json.dumps(tool_result)
+        _tool_result_json = compact_json(tool_result)
         _threshold = getattr(self.context_manager, "large_result_threshold", 800)
         if len(_tool_result_json) > _threshold:
             _tool_result_for_msg = (
@@ -2507,9 +2645,9 @@ class LangGraphOrchestrator:
                 state["pending_action"] = {"action": "finish", "answer": fail_message}
             else:
                 state["pending_action"] = None
-            state["policy_flags"]["last_tool_name"] = ""
-            state["policy_flags"]["last_tool_args"] = {}
-            state["policy_flags"]["last_tool_result"] = {}
+            flags.update(
+                last_tool_name="", last_tool_args={}, last_tool_result={}
+            )
             self.checkpoint_store.save(
                 run_id=state["run_id"],
                 step=state["step"],
@@ -2532,14 +2670,14 @@ class LangGraphOrchestrator:
                     created_at=utc_now_iso(),
                 )
             )
-            state["policy_flags"]["memo_required"] = False
-            state["policy_flags"]["memo_required_key"] = ""
-            state["policy_flags"]["memo_required_reason"] = ""
+            flags.update(
+                memo_required=False, memo_required_key="", memo_required_reason=""
+            )
             state["retry_counts"]["memo_policy"] = 0
 
-        state["policy_flags"]["last_tool_name"] = tool_name
-        state["policy_flags"]["last_tool_args"] = tool_args
-        state["policy_flags"]["last_tool_result"] = tool_result
+        flags.update(
+            last_tool_name=tool_name, last_tool_args=tool_args, last_tool_result=tool_result
+        )
         state["pending_action"] = None
 
         # Auto-memoize write_file results that require it, so the model never needs to.
@@ -2568,7 +2706,7 @@ class LangGraphOrchestrator:
                         created_at=utc_now_iso(),
                     )
                 )
-                state["policy_flags"]["last_tool_name"] = "memoize"
+                flags["last_tool_name"] = "memoize"
                 self.logger.info(
                     "AUTO MEMOIZE step=%s tool=write_file key=%s", state["step"], _auto_key
                 )
@@ -2584,15 +2722,17 @@ class LangGraphOrchestrator:
     def _enforce_memo_policy(self, state: RunState) -> RunState:
         """Require memoization after heavy deterministic tool results."""
         state = ensure_state_defaults(state, system_prompt=self.system_prompt)
-        last_tool_name = str(state["policy_flags"].get("last_tool_name", ""))
+        flags = state["policy_flags"]
+        last_tool_name = str(flags.get("last_tool_name", ""))
         if not last_tool_name:
             return state
 
         if last_tool_name in {"memoize", "retrieve_memo"}:
             return state
 
-        last_args = dict(state["policy_flags"].get("last_tool_args", {}))
-        last_result = dict(state["policy_flags"].get("last_tool_result", {}))
+        # Read-only views: the policy never mutates args/result, so no copies needed.
+        last_args = flags.get("last_tool_args", {})
+        last_result = flags.get("last_tool_result", {})
         if self.policy.requires_memoization(
             tool_name=last_tool_name,
             args=last_args,
@@ -2603,10 +2743,10 @@ class LangGraphOrchestrator:
                 args=last_args,
                 result=last_result,
             )
-            state["policy_flags"]["memo_required"] = True
-            state["policy_flags"]["memo_required_key"] = memo_key
-            state["policy_flags"]["memo_required_reason"] = (
-                f"heavy deterministic result from {last_tool_name}"
+            flags.update(
+                memo_required=True,
+                memo_required_key=memo_key,
+                memo_required_reason=f"heavy deterministic result from {last_tool_name}",
             )
             state["messages"].append(
                 {
@@ -2634,19 +2774,7 @@ class LangGraphOrchestrator:
 
     def _is_unrecoverable_plan_error(self, error_text: str) -> bool:
         """Detect provider/runtime errors where retrying the same prompt is pointless."""
-        normalized = error_text.lower()
-        unrecoverable_markers = (
-            "model",
-            "not found",
-            "invalid api key",
-            "authentication",
-            "permission",
-            "insufficient_quota",
-            "rate limit exceeded",
-        )
-        if "model" in normalized and "not found" in normalized:
-            return True
-        return any(marker in normalized for marker in unrecoverable_markers[2:])
+        return _UNRECOVERABLE_PLAN_ERROR_RE.search(error_text) is not None
 
     def _finalize(self, state: RunState) -> RunState:
         """Finalize run answer and emit mission-level summary logs."""
@@ -3026,24 +3154,23 @@ class LangGraphOrchestrator:
                 "TOOL RESULT step=%s tool=%s result=%s", state["step"], "retrieve_memo", tool_result
             )
             self._record_retrieve_memo_trace(state=state, tool_result=tool_result)
-            state["tool_call_counts"]["retrieve_memo"] = (
-                int(state["tool_call_counts"].get("retrieve_memo", 0)) + 1
-            )
+            call_counts = state["tool_call_counts"]
+            call_counts["retrieve_memo"] = call_counts.get("retrieve_memo", 0) + 1
             call_number = len(state["tool_history"]) + 1
             state["tool_history"].append(
-                {
-                    "call": call_number,
-                    "tool": "retrieve_memo",
-                    "args": retrieve_args,
-                    "result": tool_result,
-                }
+                ToolRecord(
+                    call=call_number,
+                    tool="retrieve_memo",
+                    args=retrieve_args,
+                    result=tool_result,
+                )
             )
             self._record_mission_tool_event(state, "retrieve_memo", tool_result)
             state["messages"].append(
                 {
                     "role": "system",
                     "content": (
-                        f"TOOL_RESULT #{call_number} (retrieve_memo): {json.dumps(tool_result)}\n"
+                        f"TOOL_RESULT #{call_number} (retrieve_memo): {compact_json(tool_result)}\n"
                         f"{progress_hint}"
                     ),
                 }
@@ -3162,17 +3289,16 @@ class LangGraphOrchestrator:
             )
             state["active_mission_index"] = target_index
             state["active_mission_id"] = target_index + 1
-            state["tool_call_counts"]["write_file"] = (
-                int(state["tool_call_counts"].get("write_file", 0)) + 1
-            )
+            call_counts = state["tool_call_counts"]
+            call_counts["write_file"] = call_counts.get("write_file", 0) + 1
             call_number = len(state["tool_history"]) + 1
             state["tool_history"].append(
-                {
-                    "call": call_number,
-                    "tool": "write_file",
-                    "args": write_args,
-                    "result": tool_result,
-                }
+                ToolRecord(
+                    call=call_number,
+                    tool="write_file",
+                    args=write_args,
+                    result=tool_result,
+                )
             )
             self._record_mission_tool_event(
                 state,
@@ -3189,7 +3315,7 @@ class LangGraphOrchestrator:
                 {
                     "role": "system",
                     "content": (
-                        f"TOOL_RESULT #{call_number} (write_file): {json.dumps(tool_result)}\n"
+                        f"TOOL_RESULT #{call_number} (write_file): {compact_json(tool_result)}\n"
                         f"{progress_hint}"
                     ),
                 }
@@ -3228,15 +3354,16 @@ class LangGraphOrchestrator:
         if not path or not content:
             return
 
-        for key in self._write_cache_candidates(path):
-            put_result = self.memo_store.put(
-                run_id="shared",
-                key=key,
-                value={"path": path, "content": content},
-                namespace="cache",
-                source_tool="write_file_cache",
-                step=state["step"],
-            )
+        # All alias keys share one value; write them in a single transaction.
+        put_results = self.memo_store.put_many(
+            run_id="shared",
+            keys=self._write_cache_candidates(path),
+            value={"path": path, "content": content},
+            namespace="cache",
+            source_tool="write_file_cache",
+            step=state["step"],
+        )
+        for put_result in put_results:
             state["memo_events"].append(
                 MemoEvent(
                     key=put_result.key,
@@ -7,13 +7,14 @@ for synchronous operations (called from sync graph node code).
 from __future__ import annotations
 
 import json
+from collections.abc import Sequence
 from typing import Any
 
 from psycopg_pool import ConnectionPool
 
 from agentic_workflows.logger import get_logger
 from agentic_workflows.orchestration.langgraph.memo_store import MemoLookupResult, PutResult
-from agentic_workflows.orchestration.langgraph.state_schema import hash_json
+from agentic_workflows.orchestration.langgraph.state_schema import hash_json, utc_now_iso
 
 
 class PostgresMemoStore:
@@ -35,48 +36,81 @@ class PostgresMemoStore:
         created_at: str = "",
     ) -> PutResult:
         """Insert or update a memo entry with deterministic hash metadata."""
+        return self.put_many(
+            run_id=run_id,
+            keys=[key],
+            value=value,
+            namespace=namespace,
+            source_tool=source_tool,
+            step=step,
+            created_at=created_at,
+        )[0]
+
+    def put_many(
+        self,
+        *,
+        run_id: str,
+        keys: Sequence[str],
+        value: Any,
+        namespace: str = "run",
+        source_tool: str = "memoize",
+        step: int = 0,
+        created_at: str = "",
+    ) -> list[PutResult]:
+        """Store one value under several keys in a single transaction.
+
+        Re-putting an unchanged value is a no-op: the row keeps the step,
+        source_tool and created_at of the put that first stored that value, so
+        provenance points at where the value was produced rather than its latest
+        re-put. ``inserted`` is False for such keys.
+        """
         value_json = json.dumps(value, sort_keys=True, default=str)
         value_hash = hash_json(value)
-        timestamp = created_at or ""
-        if not timestamp:
-            from agentic_workflows.orchestration.langgraph.state_schema import utc_now_iso
-
-            timestamp = utc_now_iso()
+        timestamp = created_at or utc_now_iso()
 
+        results: list[PutResult] = []
         with self._pool.connection() as conn:
-            conn.execute(
-                """
-                INSERT INTO memo_entries (
-                    run_id, namespace, key, value_json, value_hash,
-                    source_tool, step, created_at
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT(run_id, namespace, key) DO UPDATE SET
-                    value_json=EXCLUDED.value_json,
-                    value_hash=EXCLUDED.value_hash,
-                    source_tool=EXCLUDED.source_tool,
-                    step=EXCLUDED.step,
-                    created_at=EXCLUDED.created_at
-                """,
-                (run_id, namespace, key, value_json, value_hash, source_tool, step, timestamp),
-            )
-
-        self.logger.info(
-            "MEMO PUT run_id=%s namespace=%s key=%s value_hash=%s source_tool=%s step=%s",
-            run_id,
-            namespace,
-            key,
-            value_hash,
-            source_tool,
-            step,
-        )
+            for key in keys:
+                cursor = conn.execute(
+                    """
+                    INSERT INTO memo_entries (
+                        run_id, namespace, key, value_json, value_hash,
+                        source_tool, step, created_at
+                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                    ON CONFLICT(run_id, namespace, key) DO UPDATE SET
+                        value_json=EXCLUDED.value_json,
+                        value_hash=EXCLUDED.value_hash,
+                        source_tool=EXCLUDED.source_tool,
+                        step=EXCLUDED.step,
+                        created_at=EXCLUDED.created_at
+                    WHERE memo_entries.value_hash IS DISTINCT FROM EXCLUDED.value_hash
+                    """,
+                    (run_id, namespace, key, value_json, value_hash, source_tool, step, timestamp),
+                )
+                # Identical value: no-op upsert (no page/WAL write), provenance kept.
+                results.append(
+                    PutResult(
+                        inserted=cursor.rowcount > 0,
+                        run_id=run_id,
+                        key=key,
+                        namespace=namespace,
+                        value_hash=value_hash,
+                    )
+                )
 
-        return PutResult(
-            inserted=True,
-            run_id=run_id,
-            key=key,
-            namespace=namespace,
-            value_hash=value_hash,
-        )
+        for result in results:
+            self.logger.info(
+                "MEMO PUT run_id=%s namespace=%s key=%s value_hash=%s source_tool=%s step=%s "
+                "inserted=%s",
+                run_id,
+                namespace,
+                result.key,
+                value_hash,
+                source_tool,
+                step,
+                result.inserted,
+            )
+        return results
 
     def get(self, *, run_id: str, key: str, namespace: str = "run") -> MemoLookupResult:
         """Retrieve a memoized value for a specific run and key."""
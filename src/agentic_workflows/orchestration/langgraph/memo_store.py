@@ -4,19 +4,27 @@ from __future__ import annotations
 
 The store tracks memo entries per run and namespace, enabling deterministic
 verification that memoization occurred during execution.
+
+Uses a persistent WAL-mode connection guarded by a lock, matching
+SQLiteCheckpointStore, so memo-heavy runs do not pay connect + fsync per call.
 """
 
 import json
 import sqlite3
+import threading
+from collections.abc import Sequence
 from dataclasses import dataclass
+from hashlib import sha256
 from pathlib import Path
 from typing import Any
 
 from agentic_workflows.logger import get_logger
-from agentic_workflows.orchestration.langgraph.state_schema import hash_json
+from agentic_workflows.orchestration.langgraph.state_schema import utc_now_iso
+
+_LIST_COLUMNS = ("key", "value_hash", "source_tool", "step", "created_at")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PutResult:
     """Metadata returned after writing a memo entry."""
 
@@ -27,7 +35,7 @@ class PutResult:
     value_hash: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MemoLookupResult:
     """Lookup result used by retrieval tools and diagnostics."""
 
@@ -46,17 +54,22 @@ class SQLiteMemoStore:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self.logger = get_logger("langgraph.memo_store")
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
         self._initialize_schema()
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
         conn.row_factory = sqlite3.Row
         return conn
 
     def _initialize_schema(self) -> None:
         """Create memo table/index schema if absent."""
-        with self._connect() as conn:
-            conn.executescript(
+        with self._lock:
+            self._conn.executescript(
                 """
                 CREATE TABLE IF NOT EXISTS memo_entries (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -72,8 +85,17 @@ class SQLiteMemoStore:
 
                 CREATE UNIQUE INDEX IF NOT EXISTS uq_memo_entries_run_key
                 ON memo_entries(run_id, namespace, key);
+
+                -- get_latest: seek (namespace, key), walk rowid backwards.
+                CREATE INDEX IF NOT EXISTS ix_memo_entries_ns_key
+                ON memo_entries(namespace, key);
+
+                -- list_entries: rows come back already in (step, id) order.
+                CREATE INDEX IF NOT EXISTS ix_memo_entries_run_ns_step
+                ON memo_entries(run_id, namespace, step);
                 """
             )
+            self._conn.commit()
 
     def put(
         self,
@@ -87,52 +109,87 @@ class SQLiteMemoStore:
         created_at: str = "",
     ) -> PutResult:
         """Insert or update a memo entry with deterministic hash metadata."""
-        value_json = json.dumps(value, sort_keys=True, default=str)
-        value_hash = hash_json(value)
-        timestamp = created_at or ""
-        if not timestamp:
-            from agentic_workflows.orchestration.langgraph.state_schema import utc_now_iso
+        return self.put_many(
+            run_id=run_id,
+            keys=[key],
+            value=value,
+            namespace=namespace,
+            source_tool=source_tool,
+            step=step,
+            created_at=created_at,
+        )[0]
 
-            timestamp = utc_now_iso()
+    def put_many(
+        self,
+        *,
+        run_id: str,
+        keys: Sequence[str],
+        value: Any,
+        namespace: str = "run",
+        source_tool: str = "memoize",
+        step: int = 0,
+        created_at: str = "",
+    ) -> list[PutResult]:
+        """Store one value under several keys in a single transaction.
 
-        with self._connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO memo_entries (
-                    run_id, namespace, key, value_json, value_hash, source_tool, step, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(run_id, namespace, key) DO UPDATE SET
-                    value_json=excluded.value_json,
-                    value_hash=excluded.value_hash,
-                    source_tool=excluded.source_tool,
-                    step=excluded.step,
-                    created_at=excluded.created_at
-                """,
-                (run_id, namespace, key, value_json, value_hash, source_tool, step, timestamp),
-            )
+        Re-putting an unchanged value is a no-op: the row keeps the step,
+        source_tool and created_at of the put that first stored that value, so
+        provenance points at where the value was produced rather than its latest
+        re-put. ``inserted`` is False for such keys.
+        """
+        # Same canonical text hash_json() digests; serialize once and reuse it.
+        value_json = json.dumps(value, sort_keys=True, default=str)
+        value_hash = sha256(value_json.encode("utf-8")).hexdigest()
+        timestamp = created_at or utc_now_iso()
 
-        self.logger.info(
-            "MEMO PUT run_id=%s namespace=%s key=%s value_hash=%s source_tool=%s step=%s",
-            run_id,
-            namespace,
-            key,
-            value_hash,
-            source_tool,
-            step,
-        )
+        results: list[PutResult] = []
+        with self._lock, self._conn as conn:
+            for key in keys:
+                cursor = conn.execute(
+                    """
+                    INSERT INTO memo_entries (
+                        run_id, namespace, key, value_json, value_hash, source_tool, step,
+                        created_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(run_id, namespace, key) DO UPDATE SET
+                        value_json=excluded.value_json,
+                        value_hash=excluded.value_hash,
+                        source_tool=excluded.source_tool,
+                        step=excluded.step,
+                        created_at=excluded.created_at
+                    WHERE memo_entries.value_hash != excluded.value_hash
+                    """,
+                    (run_id, namespace, key, value_json, value_hash, source_tool, step, timestamp),
+                )
+                # Identical value: no-op upsert (no page/WAL write), provenance kept.
+                results.append(
+                    PutResult(
+                        inserted=cursor.rowcount > 0,
+                        run_id=run_id,
+                        key=key,
+                        namespace=namespace,
+                        value_hash=value_hash,
+                    )
+                )
 
-        return PutResult(
-            inserted=True,
-            run_id=run_id,
-            key=key,
-            namespace=namespace,
-            value_hash=value_hash,
-        )
+        for result in results:
+            self.logger.info(
+                "MEMO PUT run_id=%s namespace=%s key=%s value_hash=%s source_tool=%s step=%s "
+                "inserted=%s",
+                run_id,
+                namespace,
+                result.key,
+                value_hash,
+                source_tool,
+                step,
+                result.inserted,
+            )
+        return results
 
     def get(self, *, run_id: str, key: str, namespace: str = "run") -> MemoLookupResult:
         """Retrieve a memoized value for a specific run and key."""
-        with self._connect() as conn:
-            row = conn.execute(
+        with self._lock:
+            row = self._conn.execute(
                 """
                 SELECT value_json, value_hash
                 FROM memo_entries
@@ -164,8 +221,8 @@ class SQLiteMemoStore:
 
     def get_latest(self, *, key: str, namespace: str = "run") -> MemoLookupResult:
         """Retrieve latest memoized value by key across all run ids."""
-        with self._connect() as conn:
-            row = conn.execute(
+        with self._lock:
+            row = self._conn.execute(
                 """
                 SELECT run_id, value_json, value_hash
                 FROM memo_entries
@@ -202,8 +259,11 @@ class SQLiteMemoStore:
 
     def list_entries(self, *, run_id: str, namespace: str = "run") -> list[dict[str, Any]]:
         """List memo metadata for visibility/reporting (no model call required)."""
-        with self._connect() as conn:
-            rows = conn.execute(
+        with self._lock:
+            # Plain tuple rows + zip avoid the sqlite3.Row -> dict copy per row.
+            cursor = self._conn.cursor()
+            cursor.row_factory = None
+            rows = cursor.execute(
                 """
                 SELECT key, value_hash, source_tool, step, created_at
                 FROM memo_entries
@@ -212,7 +272,7 @@ class SQLiteMemoStore:
                 """,
                 (run_id, namespace),
             ).fetchall()
-        entries = [dict(row) for row in rows]
+        entries = [dict(zip(_LIST_COLUMNS, row, strict=True)) for row in rows]
         self.logger.info(
             "MEMO LIST run_id=%s namespace=%s count=%s",
             run_id,
@@ -225,7 +285,7 @@ class SQLiteMemoStore:
         self, *, run_id: str, key: str, namespace: str = "run", value_hash: str | None = None
     ) -> int:
         """Delete memo entries by key (optionally constrained by hash)."""
-        with self._connect() as conn:
+        with self._lock, self._conn as conn:
             if value_hash:
                 cursor = conn.execute(
                     """
@@ -253,6 +313,10 @@ class SQLiteMemoStore:
         )
         return deleted
 
+    def close(self) -> None:
+        """Close the underlying connection."""
+        self._conn.close()
+
     def get_cache_value(self, *, key: str, run_id: str = "shared") -> dict[str, Any] | None:
         """Return cached dict payload for shared cache keys, if present."""
         lookup = self.get(run_id=run_id, key=key, namespace="cache")
@@ -12,7 +12,9 @@ import os
 import queue
 import re
 import threading
+import time
 from dataclasses import dataclass, field
+from itertools import pairwise
 from typing import TYPE_CHECKING, Any
 
 from agentic_workflows.logger import get_logger
@@ -47,6 +49,32 @@ _COMPLEX_TOOLS: set[str] = {
     "http_request",
 }
 
+# Line-classification patterns used by the structured and fallback parsers.
+_TASK_N_RE = re.compile(r"^[Tt]ask\s*(\d+)\s*:\s*(.+)")
+_NUM_DELIM_RE = re.compile(r"^(\d+)\s*[\)\.:\-]\s+(.+)")
+_BULLET_RE = re.compile(r"^[-*+]\s+(.+)")
+_SUBTASK_RE = re.compile(
+    r"^\s+"  # leading whitespace (indent)
+    r"(?:"
+    r"(\d+)([a-zA-Z])\s*[\.\):\-]\s*"  # "1a." or "1A)" etc.
+    r"|"
+    r"(\d+)\.(\d+)\s*[\.\):\-]?\s*"  # "1.1" or "1.1." etc.
+    r")"
+    r"(.+)"  # description
+)
+_ANY_TASK_LINE_RE = re.compile(
+    r"^\s*(?:[Tt]ask\s*\d+\s*:|"  # Task N:
+    r"\d+\s*[\)\.:\-]\s|"  # N. or N) etc.
+    r"\d+[a-z]\s*[\.\):\-]|"  # 1a. etc.
+    r"\d+\.\d+\s*[\.\):\-]?|"  # 1.1 etc.
+    r"[-*+]\s)"  # bullets
+)
+# First characters (besides decimal digits) a stripped task or bullet line can start with.
+_TASK_LEAD_CHARS = frozenset("Tt-*+")
+_FALLBACK_TASK_LINE_RE = re.compile(r"^(?:task\s*\d+\s*:|\d+[\)\.:\-\s])", re.IGNORECASE)
+_CLAUSE_LEAD_PUNCT_RE = re.compile(r"^[,;]\s*")
+_CLAUSE_LEAD_CONJ_RE = re.compile(r"^(and\s+then|then|and)\s+", re.IGNORECASE)
+
 
 @dataclass
 class IntentClassification:
@@ -274,6 +302,10 @@ _TOOL_KEYWORD_MAP: dict[str, list[str]] = {
     "recall": ["query_context"],
     "remember": ["query_context"],
 }
+# Immutable snapshot of the map for the per-step hot loop (tuples iterate faster).
+_TOOL_KEYWORDS: tuple[tuple[str, tuple[str, ...]], ...] = tuple(
+    (keyword, tuple(tools)) for keyword, tools in _TOOL_KEYWORD_MAP.items()
+)
 
 
 _LOCAL_PROVIDERS = {"LlamaCppChatProvider", "OllamaChatProvider"}
@@ -312,6 +344,20 @@ def _adaptive_classifier_timeout(provider: ChatProvider | None) -> float:
     return _DEFAULT_CLOUD_CLASSIFIER_TIMEOUT
 
 
+@dataclass(frozen=True)
+class _Deadline:
+    """Monotonic cut-off checked cooperatively by the parsing loops."""
+
+    at: float | None = None
+
+    def check(self) -> None:
+        if self.at is not None and time.monotonic() > self.at:
+            raise TimeoutError
+
+
+_NO_DEADLINE = _Deadline()
+
+
 def parse_missions(
     user_input: str,
     timeout_seconds: float = 5.0,
@@ -322,7 +368,8 @@ def parse_missions(
     """Parse user input into a StructuredPlan.
 
     Tries structured parsing first, falls back to flat regex extraction.
-    Protected by a hard timeout to prevent runaway parsing on huge inputs.
+    Protected by a per-line deadline check to prevent runaway parsing on huge
+    inputs; on timeout or error the regex fallback plan is returned.
 
     If the parsed plan has more than *max_plan_steps* top-level steps,
     excess steps are merged into the last allowed step to prevent
@@ -334,61 +381,22 @@ def parse_missions(
         max_plan_steps,
         len(user_input),
     )
-    if timeout_seconds <= 0:
-        plan = _parse_missions_inner(user_input)
-        limited = _enforce_step_limit(plan, max_plan_steps)
-        _apply_intent_classification(
-            limited, user_input, classifier_provider, classifier_timeout
-        )
-        LOGGER.info(
-            "PARSER RESULT method=%s steps=%s flat_missions=%s",
-            limited.parsing_method,
-            len(limited.steps),
-            len(limited.flat_missions),
-        )
-        return limited
-
-    outbox: queue.Queue[tuple[str, Any]] = queue.Queue(maxsize=1)
-
-    def _run() -> None:
-        try:
-            outbox.put(("ok", _parse_missions_inner(user_input)))
-        except Exception as exc:  # noqa: BLE001
-            outbox.put(("err", exc))
-
-    thread = threading.Thread(target=_run, daemon=True)
-    thread.start()
+    guarded = timeout_seconds > 0
+    deadline = _Deadline(time.monotonic() + timeout_seconds) if guarded else _NO_DEADLINE
     try:
-        kind, payload = outbox.get(timeout=timeout_seconds)
-    except queue.Empty:
+        plan = _parse_missions_inner(user_input, deadline)
+    except TimeoutError:
+        if not guarded:
+            raise
         LOGGER.warning("PARSER FALLBACK reason=timeout timeout_seconds=%.2f", timeout_seconds)
-        fallback = _enforce_step_limit(_build_fallback_plan(user_input), max_plan_steps)
-        _apply_intent_classification(
-            fallback, user_input, classifier_provider, classifier_timeout
-        )
-        LOGGER.info(
-            "PARSER RESULT method=%s steps=%s flat_missions=%s",
-            fallback.parsing_method,
-            len(fallback.steps),
-            len(fallback.flat_missions),
-        )
-        return fallback
-
-    if kind == "err":
+        plan = _build_fallback_plan(user_input)
+    except Exception:
+        if not guarded:
+            raise
         LOGGER.info("PARSER FALLBACK reason=exception")
-        fallback = _enforce_step_limit(_build_fallback_plan(user_input), max_plan_steps)
-        _apply_intent_classification(
-            fallback, user_input, classifier_provider, classifier_timeout
-        )
-        LOGGER.info(
-            "PARSER RESULT method=%s steps=%s flat_missions=%s",
-            fallback.parsing_method,
-            len(fallback.steps),
-            len(fallback.flat_missions),
-        )
-        return fallback
+        plan = _build_fallback_plan(user_input)
 
-    limited = _enforce_step_limit(payload, max_plan_steps)
+    limited = _enforce_step_limit(plan, max_plan_steps)
     _apply_intent_classification(
         limited, user_input, classifier_provider, classifier_timeout
     )
@@ -533,24 +541,24 @@ def _classify_intent(
         return _deterministic_classify(plan)
 
 
-def _parse_missions_inner(user_input: str) -> StructuredPlan:
-    """Core parsing logic without timeout wrapper."""
-    lines = [line.rstrip() for line in user_input.splitlines()]
+def _parse_missions_inner(
+    user_input: str, deadline: _Deadline = _NO_DEADLINE
+) -> StructuredPlan:
+    """Core parsing logic; raises TimeoutError once *deadline* has passed."""
+    lines = list(map(str.rstrip, user_input.splitlines()))
 
     # Try structured numbered tasks first
-    steps = _parse_numbered_tasks(lines)
+    steps = _parse_numbered_steps(lines, deadline)
     if steps:
-        _parse_nested_subtasks(lines, steps)
-        _parse_multiline_descriptions(lines, steps)
-        _suggest_tools_for_steps(steps)
+        _suggest_tools_for_steps(steps, deadline)
         _detect_dependencies(steps)
         flat = _steps_to_flat_missions(steps)
         return StructuredPlan(steps=steps, flat_missions=flat, parsing_method="structured")
 
     # Try bullet list parsing
-    steps = _parse_bullet_lists(lines)
+    steps = _parse_bullet_lists(lines, deadline)
     if steps:
-        _suggest_tools_for_steps(steps)
+        _suggest_tools_for_steps(steps, deadline)
         _detect_dependencies(steps)
         flat = _steps_to_flat_missions(steps)
         return StructuredPlan(steps=steps, flat_missions=flat, parsing_method="structured")
@@ -559,135 +567,121 @@ def _parse_missions_inner(user_input: str) -> StructuredPlan:
     return _build_fallback_plan(user_input)
 
 
-def _parse_numbered_tasks(lines: list[str]) -> list[MissionStep]:
-    """Handle `Task N:`, `N.`, `N)`, `N -` patterns for top-level tasks."""
+def _parse_numbered_steps(
+    lines: list[str], deadline: _Deadline = _NO_DEADLINE
+) -> list[MissionStep]:
+    """Parse numbered top-level tasks, their sub-tasks and continuation lines.
+
+    Each line is regex-classified exactly once.  Top-level tasks use `Task N:`,
+    `N.`, `N)`, `N -`, `N:` patterns.  Indented sub-tasks use letter (`1a.`,
+    `2b)`) or dot (`1.1`, `1.2.`) sub-IDs and are kept when their parent task
+    exists.  Indented lines that match no task pattern are merged into the
+    description of the task/sub-task above them; a blank line ends that merge.
+    Returns top-level steps followed by sub-tasks.
+    """
     steps: list[MissionStep] = []
+    subtasks: list[MissionStep] = []
+    # Per line: a parsed step, None for a blank line, "" for a task-like line
+    # that yields no step, or the stripped text of a continuation candidate.
+    entries: list[MissionStep | str | None] = []
+    has_continuation = False
     for line in lines:
+        deadline.check()
         stripped = line.strip()
         if not stripped:
+            entries.append(None)
+            continue
+        first = stripped[0]
+        if first not in _TASK_LEAD_CHARS and not first.isdecimal():
+            # Prose: no task pattern can match, skip the regex engine.
+            if line.startswith(("  ", "\t")):
+                entries.append(stripped)
+                has_continuation = True
+            else:
+                entries.append("")
             continue
-        # Task N: ...
-        m = re.match(r"^[Tt]ask\s*(\d+)\s*:\s*(.+)", stripped)
+        m = _TASK_N_RE.match(stripped) or _NUM_DELIM_RE.match(stripped)
         if m:
-            steps.append(MissionStep(id=m.group(1), description=m.group(2).strip()))
+            step = MissionStep(id=m.group(1), description=m.group(2).strip())
+            steps.append(step)
+            entries.append(step)
             continue
-        # N. ... or N) ... or N - ... or N: ...
-        m = re.match(r"^(\d+)\s*[\)\.:\-]\s+(.+)", stripped)
+        m = _SUBTASK_RE.match(line)
         if m:
-            steps.append(MissionStep(id=m.group(1), description=m.group(2).strip()))
+            if m.group(1):
+                parent_id, sub_id = m.group(1), f"{m.group(1)}{m.group(2)}"
+            else:
+                parent_id, sub_id = m.group(3), f"{m.group(3)}.{m.group(4)}"
+            step = MissionStep(id=sub_id, description=m.group(5).strip(), parent_id=parent_id)
+            subtasks.append(step)
+            entries.append(step)
             continue
+        if _ANY_TASK_LINE_RE.match(line) or not line.startswith(("  ", "\t")):
+            entries.append("")
+            continue
+        entries.append(stripped)
+        has_continuation = True
+
+    # A sub-task needs a parent anywhere in the input and a not-yet-used ID.
+    seen_ids = {step.id for step in steps}
+    parent_ids = frozenset(seen_ids)
+    kept: set[int] = {id(step) for step in steps}
+    for subtask in subtasks:
+        if subtask.parent_id in parent_ids and subtask.id not in seen_ids:
+            seen_ids.add(subtask.id)
+            kept.add(id(subtask))
+            steps.append(subtask)
+
+    if not has_continuation:
+        return steps
+    current_step: MissionStep | None = None
+    for entry in entries:
+        if entry is None:
+            current_step = None
+        elif isinstance(entry, MissionStep):
+            if id(entry) in kept:
+                current_step = entry
+        elif entry and current_step is not None:
+            current_step.description += " " + entry
     return steps
 
 
-def _parse_bullet_lists(lines: list[str]) -> list[MissionStep]:
+def _parse_bullet_lists(
+    lines: list[str], deadline: _Deadline = _NO_DEADLINE
+) -> list[MissionStep]:
     """Handle `- `, `* `, `+ ` bullet patterns."""
     steps: list[MissionStep] = []
     counter = 0
     for line in lines:
+        deadline.check()
         stripped = line.strip()
-        if not stripped:
+        if not stripped or stripped[0] not in "-*+":
             continue
-        m = re.match(r"^[-*+]\s+(.+)", stripped)
+        m = _BULLET_RE.match(stripped)
         if m:
             counter += 1
             steps.append(MissionStep(id=str(counter), description=m.group(1).strip()))
     return steps
 
 
-def _parse_nested_subtasks(lines: list[str], parent_steps: list[MissionStep]) -> None:
-    """Detect indented sub-task lines and attach them as children.
-
-    Recognizes patterns like:
-      - `1a.`, `1b.`, `2a)`, etc.  (letter-suffixed sub-IDs)
-      - `1.1`, `1.2`, `2.1`, etc.  (dot-notation sub-IDs)
-      - 2+ space indented lines under a parent
-    """
-    parent_ids = {s.id for s in parent_steps}
-    subtask_re = re.compile(
-        r"^\s+"  # leading whitespace (indent)
-        r"(?:"
-        r"(\d+)([a-z])\s*[\.\):\-]\s*"  # "1a." or "1a)" etc.
-        r"|"
-        r"(\d+)\.(\d+)\s*[\.\):\-]?\s*"  # "1.1" or "1.1." etc.
-        r")"
-        r"(.+)",  # description
-        re.IGNORECASE,
-    )
-    for line in lines:
-        m = subtask_re.match(line)
-        if not m:
-            continue
-        if m.group(1) and m.group(2):
-            parent_id = m.group(1)
-            sub_id = f"{m.group(1)}{m.group(2)}"
-            desc = m.group(5).strip()
-        elif m.group(3) and m.group(4):
-            parent_id = m.group(3)
-            sub_id = f"{m.group(3)}.{m.group(4)}"
-            desc = m.group(5).strip()
-        else:
-            continue
-
-        if parent_id not in parent_ids:
-            continue
-        # Avoid duplicates
-        if any(s.id == sub_id for s in parent_steps):
-            continue
-        parent_steps.append(MissionStep(id=sub_id, description=desc, parent_id=parent_id))
-
-
-def _parse_multiline_descriptions(lines: list[str], steps: list[MissionStep]) -> None:
-    """Merge indented continuation lines that don't match any task/subtask pattern into prior step."""
-    task_pattern = re.compile(
-        r"^\s*(?:[Tt]ask\s*\d+\s*:|"  # Task N:
-        r"\d+\s*[\)\.:\-]\s|"  # N. or N) etc.
-        r"\d+[a-z]\s*[\.\):\-]|"  # 1a. etc.
-        r"\d+\.\d+\s*[\.\):\-]?|"  # 1.1 etc.
-        r"[-*+]\s)"  # bullets
-    )
-    current_step: MissionStep | None = None
-    step_by_line: dict[int, MissionStep] = {}
-
-    # Map each step to its line index
-    for li, line in enumerate(lines):
-        stripped = line.strip()
-        for step in steps:
-            if step.description and stripped.endswith(step.description):
-                step_by_line[li] = step
-                current_step = step
-                break
-
-    for li, line in enumerate(lines):
-        stripped = line.strip()
-        if not stripped:
-            current_step = None
-            continue
-        if li in step_by_line:
-            current_step = step_by_line[li]
-            continue
-        if task_pattern.match(line):
-            continue
-        # Continuation line: indented, not a task pattern
-        if (line.startswith("  ") or line.startswith("\t")) and current_step:
-            current_step.description += " " + stripped
-
-
-def _suggest_tools_for_steps(steps: list[MissionStep]) -> None:
+def _suggest_tools_for_steps(
+    steps: list[MissionStep], deadline: _Deadline = _NO_DEADLINE
+) -> None:
     """Apply keyword heuristic to suggest tools for each step."""
     for step in steps:
+        deadline.check()
         _suggest_tools_for_step(step)
 
 
 def _suggest_tools_for_step(step: MissionStep) -> None:
     """Keyword heuristic mapping from step description to tool names."""
     desc_lower = step.description.lower()
-    suggested: list[str] = []
-    for keyword, tools in _TOOL_KEYWORD_MAP.items():
+    suggested: dict[str, None] = {}
+    for keyword, tools in _TOOL_KEYWORDS:
         if keyword in desc_lower:
             for tool in tools:
-                if tool not in suggested:
-                    suggested.append(tool)
-    step.suggested_tools = suggested
+                suggested[tool] = None
+    step.suggested_tools = list(suggested)
 
 
 def _detect_dependencies(steps: list[MissionStep]) -> None:
@@ -700,13 +694,13 @@ def _detect_dependencies(steps: list[MissionStep]) -> None:
     for step in steps:
         parent_children.setdefault(step.parent_id, []).append(step)
 
-    for _parent_id, children in parent_children.items():
-        for i, child in enumerate(children):
-            if i > 0:
-                child.dependencies.append(children[i - 1].id)
-            # First child of a parent depends on the parent
-            if child.parent_id and child.parent_id not in child.dependencies and i == 0:
-                child.dependencies.append(child.parent_id)
+    for children in parent_children.values():
+        # First child of a parent depends on the parent
+        first = children[0]
+        if first.parent_id and first.parent_id not in first.dependencies:
+            first.dependencies.append(first.parent_id)
+        for previous, child in pairwise(children):
+            child.dependencies.append(previous.id)
 
 
 def _steps_to_flat_missions(steps: list[MissionStep]) -> list[str]:
@@ -809,14 +803,8 @@ def _extract_missions_regex_fallback(user_input: str) -> list[str]:
     like ", then", ", and then", "and write", etc.  Only returns
     ["Primary mission"] when no decomposition is possible.
     """
-    lines = [line.strip() for line in user_input.splitlines() if line.strip()]
-    task_lines: list[str] = []
-    for line in lines:
-        if re.match(r"^(task\s*\d+\s*:)", line, flags=re.IGNORECASE):
-            task_lines.append(line)
-            continue
-        if re.match(r"^\d+[\)\.:\-\s]", line):
-            task_lines.append(line)
+    lines = [line for line in map(str.strip, user_input.splitlines()) if line]
+    task_lines = [line for line in lines if _FALLBACK_TASK_LINE_RE.match(line)]
     if task_lines:
         return task_lines
 
@@ -876,8 +864,8 @@ def _split_prose_spacy(text: str) -> list[str]:
 
         span_text = doc[start:end].text.strip()
         # Clean up leading conjunctions/punctuation
-        span_text = re.sub(r"^[,;]\s*", "", span_text)
-        span_text = re.sub(r"^(and\s+then|then|and)\s+", "", span_text, flags=re.IGNORECASE)
+        span_text = _CLAUSE_LEAD_PUNCT_RE.sub("", span_text)
+        span_text = _CLAUSE_LEAD_CONJ_RE.sub("", span_text)
         span_text = span_text.strip().rstrip(".")
         # Skip fragments too short to be a meaningful action clause
         if span_text and len(span_text.split()) >= 3:
@@ -55,7 +55,7 @@ def resolve_mission_id_for_action(
         LOGGER.info("MISSION ATTRIBUTION skip reason=no_reports")
         return 0
     tool_name = str(action.get("tool_name", "")).strip()
-    args = dict(action.get("args", {}))
+    args = action.get("args") or {}
     helper_tools = HELPER_TOOLS
 
     def _requirements_for_report(report: dict[str, Any]) -> tuple[set[str], set[str]]:
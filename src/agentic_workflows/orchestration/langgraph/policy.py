@@ -2,6 +2,7 @@ from __future__ import annotations
 
 """Memoization policy rules for Phase 1 orchestration."""
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Any
 
@@ -18,30 +19,37 @@ class MemoizationPolicy:
         self,
         *,
         tool_name: str,
-        args: dict[str, Any],
-        result: dict[str, Any],
+        args: Mapping[str, Any],
+        result: Mapping[str, Any],
     ) -> bool:
-        """Return True when a tool result should be memoized before progress."""
+        """Return True when a tool result should be memoized before progress.
+
+        ``args`` and ``result`` are treated as read-only; callers may pass live
+        state references without copying.
+        """
         if tool_name != "write_file":
             return False
 
-        path = str(args.get("path", "")).lower()
-        content = str(args.get("content", ""))
-        if "fib" in path:
+        # Cheapest signals first: length is O(1), path/comma scans are linear.
+        content = args.get("content", "")
+        if not isinstance(content, str):
+            content = str(content)
+        content_len = len(content)
+        if content_len >= 400:
             return True
-        if len(content) >= 400:
+        if "fib" in str(args.get("path", "")).lower():
             return True
-        if content.count(",") > 20:
+        # More than 20 commas needs at least 21 characters.
+        if content_len > 20 and content.count(",") > 20:
             return True
 
         # Fallback to result-based signal when content is not available.
-        if "result" in result and "wrote" in str(result["result"]).lower():
-            return len(content) > 0 and len(content) >= 200
-
-        return False
+        if content_len < 200:
+            return False
+        return "result" in result and "wrote" in str(result["result"]).lower()
 
     def suggested_memo_key(
-        self, *, tool_name: str, args: dict[str, Any], result: dict[str, Any]
+        self, *, tool_name: str, args: Mapping[str, Any], result: Mapping[str, Any]
     ) -> str:
         """Generate a stable key for memo write/read consistency."""
         if tool_name == "write_file":
@@ -3,7 +3,9 @@ from __future__ import annotations
 """Provider adapters for Phase 1 planning model calls.
 
 All runtime/provider selection comes from `.env`, and the graph uses one unified
-`generate(messages)` provider contract regardless of vendor.
+`generate(messages)` provider contract regardless of vendor.  Vendor SDKs
+(`openai`, `groq`) are imported inside the provider constructors so only the
+selected backend pays its import cost.
 """
 
 import os
@@ -14,9 +16,9 @@ from typing import Protocol
 
 import httpx
 from dotenv import load_dotenv
-from groq import Groq
-from openai import OpenAI
 
+from agentic_workflows.http_client import shared_http_client
+from agentic_workflows.json_mode import json_mode_supported, record_json_mode_rejection
 from agentic_workflows.logger import get_logger
 from agentic_workflows.observability import observe
 from agentic_workflows.orchestration.langgraph.state_schema import AgentMessage
@@ -198,7 +200,13 @@ class OpenAIChatProvider(_RetryingProviderBase):
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError("OPENAI_API_KEY not found in environment.")
-        self.client = OpenAI(api_key=api_key, timeout=self.timeout_seconds)
+        from openai import OpenAI
+
+        self.client = OpenAI(
+            api_key=api_key,
+            timeout=self.timeout_seconds,
+            http_client=shared_http_client(),
+        )
         self.model = model or os.getenv("OPENAI_MODEL", "gpt-4.1-mini")
 
     def context_size(self) -> int:
@@ -208,11 +216,12 @@ class OpenAIChatProvider(_RetryingProviderBase):
         # Use json_schema response format to guide the model toward the expected action shape.
         # Falls back to json_object if the model does not support json_schema.
         schema_to_use = response_schema if response_schema is not None else _OPENAI_ACTION_RESPONSE_FORMAT
+        message_list = messages if isinstance(messages, list) else list(messages)
 
         def _request_schema_mode() -> object:
             return self.client.chat.completions.create(
                 model=self.model,
-                messages=list(messages),
+                messages=message_list,
                 response_format=schema_to_use,
                 timeout=self.timeout_seconds,
             )
@@ -220,7 +229,7 @@ class OpenAIChatProvider(_RetryingProviderBase):
         def _request_json_mode() -> object:
             return self.client.chat.completions.create(
                 model=self.model,
-                messages=list(messages),
+                messages=message_list,
                 response_format={"type": "json_object"},
                 timeout=self.timeout_seconds,
             )
@@ -243,7 +252,13 @@ class GroqChatProvider(_RetryingProviderBase):
         api_key = os.getenv("GROQ_API_KEY")
         if not api_key:
             raise ValueError("GROQ_API_KEY not found in environment.")
-        self.client = Groq(api_key=api_key, timeout=self.timeout_seconds)
+        from groq import Groq
+
+        self.client = Groq(
+            api_key=api_key,
+            timeout=self.timeout_seconds,
+            http_client=shared_http_client(),
+        )
         self.model = model or os.getenv("GROQ_MODEL", "llama-3.1-8b-instant")
 
     def context_size(self) -> int:
@@ -252,10 +267,11 @@ class GroqChatProvider(_RetryingProviderBase):
     def generate(self, messages: Sequence[AgentMessage], response_schema: dict | None = None) -> str:
         # response_schema ignored -- Groq has limited json_schema support
         # Keep the same JSON-object response contract across providers.
+        message_list = messages if isinstance(messages, list) else list(messages)
         response = self._request_with_retries(
             lambda: self.client.chat.completions.create(
                 model=self.model,
-                messages=list(messages),
+                messages=message_list,
                 response_format={"type": "json_object"},
                 timeout=self.timeout_seconds,
             )
@@ -278,6 +294,7 @@ class OllamaChatProvider(_RetryingProviderBase):
         resolved_model = model or os.getenv("OLLAMA_MODEL", "llama3.1:8b")
         resolved_base_url = _resolve_ollama_base_url(base_url)
         self.model = resolved_model
+        self.base_url = resolved_base_url
         self.num_ctx = _env_int("OLLAMA_NUM_CTX", 0)
         self.use_native_chat_api = _env_bool(
             "OLLAMA_USE_NATIVE_CHAT_API",
@@ -289,15 +306,16 @@ class OllamaChatProvider(_RetryingProviderBase):
         self.native_client = (
             httpx.Client(timeout=self.timeout_seconds) if self.use_native_chat_api else None
         )
-        self.client = (
-            None
-            if self.use_native_chat_api
-            else OpenAI(
+        self.client = None
+        if not self.use_native_chat_api:
+            from openai import OpenAI
+
+            self.client = OpenAI(
                 api_key="ollama",
                 base_url=resolved_base_url,
                 timeout=self.timeout_seconds,
+                http_client=shared_http_client(),
             )
-        )
 
     def context_size(self) -> int:
         return self.num_ctx if self.num_ctx > 0 else int(os.getenv("OLLAMA_NUM_CTX", "32768"))
@@ -361,13 +379,14 @@ class OllamaChatProvider(_RetryingProviderBase):
             )
 
         extra = self._ollama_extra_body()
+        message_list = messages if isinstance(messages, list) else list(messages)
 
         def _request_json_mode() -> object:
             if self.client is None:
                 raise RuntimeError("Ollama OpenAI-compatible client is not configured.")
             return self.client.chat.completions.create(
                 model=self.model,
-                messages=list(messages),
+                messages=message_list,
                 response_format={"type": "json_object"},
                 timeout=self.timeout_seconds,
                 **({"extra_body": extra} if extra else {}),
@@ -378,16 +397,22 @@ class OllamaChatProvider(_RetryingProviderBase):
                 raise RuntimeError("Ollama OpenAI-compatible client is not configured.")
             return self.client.chat.completions.create(
                 model=self.model,
-                messages=list(messages),
+                messages=message_list,
                 timeout=self.timeout_seconds,
                 **({"extra_body": extra} if extra else {}),
             )
 
-        try:
-            # Try strict JSON mode first when the local OpenAI-compatible layer supports it.
-            response = self._request_with_retries(_request_json_mode)
-        except Exception:
-            # Some local OpenAI-compatible adapters may not support response_format.
+        response = None
+        if json_mode_supported("ollama", self.base_url, self.model):
+            try:
+                # Try strict JSON mode first when the local OpenAI-compatible layer supports it.
+                response = self._request_with_retries(_request_json_mode)
+            except Exception as exc:
+                # Fall back to plain mode for this call; only an explicit
+                # response_format rejection disables JSON mode for later calls.
+                if record_json_mode_rejection(exc, "ollama", self.base_url, self.model):
+                    _LOG.info("OLLAMA JSON MODE disabled model=%s error=%s", self.model, exc)
+        if response is None:
             response = self._request_with_retries(_request_plain_mode)
         content = response.choices[0].message.content
         if content is None:
@@ -525,6 +550,7 @@ class LlamaCppChatProvider(_RetryingProviderBase):
         resolved_base_url = base_url or os.getenv(
             "LLAMA_CPP_BASE_URL", "http://127.0.0.1:8080/v1"
         )
+        self.base_url = resolved_base_url
         env_model = model or os.getenv("LLAMA_CPP_MODEL", "auto")
         if env_model.lower() == "auto":
             detected = _detect_llama_cpp_model(resolved_base_url)
@@ -537,10 +563,13 @@ class LlamaCppChatProvider(_RetryingProviderBase):
                 )
         else:
             self.model = env_model
+        from openai import OpenAI
+
         self.client = OpenAI(
             api_key="llama-cpp",
             base_url=resolved_base_url,
             timeout=self.timeout_seconds,
+            http_client=shared_http_client(),
         )
         # Grammar enforcement: disabled per-request when LLAMA_CPP_GRAMMAR=false.
         # Auto-disabled for Qwen3 models: GBNF grammar blocks <think> tokens even
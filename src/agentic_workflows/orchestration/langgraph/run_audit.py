@@ -14,6 +14,11 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup, stdlib json is the fallback
+    orjson = None  # type: ignore[assignment]
+
 DEFAULT_CHECKPOINT_DB = ".tmp/langgraph_checkpoints.db"
 DEFAULT_MEMO_DB = ".tmp/memo_store.db"
 DEFAULT_CSV_PATH = ".tmp/run_summary.csv"
@@ -86,6 +91,24 @@ def _load_latest_states(checkpoint_db_path: str) -> list[dict[str, Any]]:
     return [dict(row) for row in rows]
 
 
+def _load_state(state_json: str | bytes) -> dict[str, Any]:
+    """Decode a checkpoint ``state_json`` blob, preferring orjson.
+
+    orjson widens integers beyond 64 bits to float, which is harmless here:
+    the audit only reads counters, names and string tool args. Blobs orjson
+    rejects (e.g. NaN written by stdlib json) fall back to ``json.loads``.
+    """
+    decoded: Any = None
+    if orjson is not None:
+        try:
+            decoded = orjson.loads(state_json)
+        except orjson.JSONDecodeError:
+            decoded = None
+    if decoded is None:
+        decoded = json.loads(state_json)
+    return decoded if isinstance(decoded, dict) else {}
+
+
 def _status_from_state(node_name: str, final_answer: str) -> str:
     if node_name != "finalize":
         return "FAILED"
@@ -156,7 +179,7 @@ def summarize_runs(
     summaries: list[RunSummary] = []
 
     for row in latest_rows:
-        state = json.loads(str(row["state_json"]))
+        state = _load_state(row["state_json"])
         run_id = str(row["run_id"])
         tools_str, tools_count = _tools_by_step(state)
         retries = dict(state.get("retry_counts", {}))
@@ -367,7 +390,7 @@ def _print_run_details(run_id: str, rows: list[RunSummary], checkpoint_db_path:
         ).fetchone()
     if row is None:
         return
-    state = json.loads(str(row["state_json"]))
+    state = _load_state(row["state_json"])
     history = state.get("tool_history", [])
     if not history:
         print("No tool history for this run.")
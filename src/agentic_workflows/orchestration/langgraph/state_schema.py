@@ -10,10 +10,15 @@ before each node executes.
 import json
 import operator
 from datetime import UTC, datetime
-from hashlib import sha256
+from hashlib import blake2b, sha256
 from typing import Annotated, Any, Literal, NotRequired, TypedDict, cast
 from uuid import uuid4
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup, stdlib json is the fallback
+    orjson = None  # type: ignore[assignment]
+
 
 class AgentMessage(TypedDict):
     role: Literal["system", "user", "assistant", "tool"]
@@ -127,6 +132,30 @@ def hash_json(value: Any) -> str:
     return sha256(normalized.encode("utf-8")).hexdigest()
 
 
+def compact_json(value: Any) -> str:
+    """Serialize a tool payload for prompt messages as compact, non-ASCII-escaped JSON.
+
+    Uses orjson when installed; falls back to stdlib json (same output shape) when
+    it is missing or rejects the value (e.g. Fibonacci ints wider than 64 bits).
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, default=str).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def tool_signature(tool_name: str, tool_args: Any) -> str:
+    """Return the dedup key for a tool call stored in ``seen_tool_signatures``.
+
+    Args are digested so large payloads (e.g. write_file content) are not kept
+    verbatim in the set and in every checkpoint; the tool name stays readable.
+    """
+    normalized = json.dumps(tool_args, sort_keys=True, default=str)
+    return f"{tool_name}:{blake2b(normalized.encode('utf-8'), digest_size=16).hexdigest()}"
+
+
 def new_run_state(system_prompt: str, user_input: str, run_id: str | None = None) -> RunState:
     """Build the initial state shape for a new run."""
     return {
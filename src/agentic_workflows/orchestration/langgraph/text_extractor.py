@@ -8,6 +8,8 @@ No project imports required.
 
 import re
 
+_INT_TOKEN_RE = re.compile(r"-?\d+")
+
 
 def extract_quoted_text(text: str) -> str:
     """Return the first single- or double-quoted substring, stripped."""
@@ -113,12 +115,8 @@ def extract_write_path_from_mission(mission: str) -> str:
 
 def parse_csv_int_list(content: str) -> list[int] | None:
     """Parse a comma-separated integer list; return None on malformed tokens."""
-    tokens = [token.strip() for token in content.split(",") if token.strip()]
-    if not tokens:
-        return []
-    numbers: list[int] = []
-    for token in tokens:
-        if not re.match(r"^-?\d+$", token):
-            return None
-        numbers.append(int(token))
-    return numbers
+    tokens = [token for token in map(str.strip, content.split(",")) if token]
+    match = _INT_TOKEN_RE.fullmatch
+    if not all(map(match, tokens)):
+        return None
+    return list(map(int, tokens))
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 """Tool registry and memo-specific tool adapters for Phase 1."""
 
+from types import MappingProxyType
 from typing import Any
 
 from agentic_workflows.orchestration.langgraph.checkpoint_store import SQLiteCheckpointStore
@@ -119,21 +120,20 @@ class RetrieveMemoTool(Tool):
         }
 
 
-def build_tool_registry(
-    store: SQLiteMemoStore,
-    checkpoint_store: SQLiteCheckpointStore | None = None,
-    mission_context_store: Any = None,
-    embedding_provider: Any = None,
-) -> dict[str, Tool]:
-    """Build the full tool map used by graph execution nodes."""
-    registry: dict[str, Tool] = {
+# Stateless tools are shared by every registry; only store-backed tools are
+# built per call.  Two halves keep the memo tools at their place in the
+# (prompt-visible) registry order.
+_STATELESS_TOOLS_HEAD: MappingProxyType[str, Tool] = MappingProxyType(
+    {
         "repeat_message": EchoTool(),
         "sort_array": SortArrayTool(),
         "string_ops": StringOpsTool(),
         "math_stats": MathStatsTool(),
         "write_file": WriteFileTool(),
-        "memoize": MemoizeStoreTool(store),
-        "retrieve_memo": RetrieveMemoTool(store),
+    }
+)
+_STATELESS_TOOLS_TAIL: MappingProxyType[str, Tool] = MappingProxyType(
+    {
         "task_list_parser": TaskListParserTool(),
         "text_analysis": TextAnalysisTool(),
         "data_analysis": DataAnalysisTool(),
@@ -165,6 +165,25 @@ def build_tool_registry(
         "encode_decode": EncodeDecodeTool(),
         "validate_data": ValidateDataTool(),
     }
+)
+
+
+def build_tool_registry(
+    store: SQLiteMemoStore,
+    checkpoint_store: SQLiteCheckpointStore | None = None,
+    mission_context_store: Any = None,
+    embedding_provider: Any = None,
+) -> dict[str, Tool]:
+    """Build the full tool map used by graph execution nodes.
+
+    Returns a fresh dict (callers may filter it); stateless tool instances are shared.
+    """
+    registry: dict[str, Tool] = {
+        **_STATELESS_TOOLS_HEAD,
+        "memoize": MemoizeStoreTool(store),
+        "retrieve_memo": RetrieveMemoTool(store),
+        **_STATELESS_TOOLS_TAIL,
+    }
     if checkpoint_store is not None:
         registry["retrieve_run_context"] = RetrieveRunContextTool(checkpoint_store)
     if mission_context_store is not None:
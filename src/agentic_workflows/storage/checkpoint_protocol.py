@@ -34,3 +34,13 @@ class CheckpointStore(Protocol):
     def load_latest_run(self) -> RunState | None:
         """Load the final state of the most recent run (any run_id)."""
         ...
+
+    def append_messages(
+        self, *, run_id: str, step: int, messages: list[dict[str, Any]]
+    ) -> int:
+        """Archive messages evicted from the planner window; returns the archive row id."""
+        ...
+
+    def load_archived_messages(self, run_id: str) -> list[dict[str, Any]]:
+        """Return every archived message for a run, oldest first."""
+        ...
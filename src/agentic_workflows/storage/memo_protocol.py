@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Any, Protocol, runtime_checkable
 
 from agentic_workflows.orchestration.langgraph.memo_store import MemoLookupResult, PutResult
@@ -29,6 +30,23 @@ class MemoStore(Protocol):
         """Insert or update a memo entry with deterministic hash metadata."""
         ...
 
+    def put_many(
+        self,
+        *,
+        run_id: str,
+        keys: Sequence[str],
+        value: Any,
+        namespace: str = "run",
+        source_tool: str = "memoize",
+        step: int = 0,
+        created_at: str = "",
+    ) -> list[PutResult]:
+        """Store one value under several keys in a single transaction.
+
+        Unchanged values are not rewritten and keep their original provenance.
+        """
+        ...
+
     def get(self, *, run_id: str, key: str, namespace: str = "run") -> MemoLookupResult:
         """Retrieve a memoized value for a specific run and key."""
         ...
@@ -417,6 +417,10 @@ class LangGraphFlowTests(unittest.TestCase):
             self.assertEqual(executed_tools, ["sort_array"])
             self.assertEqual(result["state"]["retry_counts"]["duplicate_tool"], 1)
             self.assertEqual(result["derived_snapshot"]["duplicate_tool_retries"], 1)
+            # Transient rejection branches do not write their own checkpoint.
+            node_names = [cp["node_name"] for cp in result["checkpoints"]]
+            self.assertNotIn("execute_duplicate_tool", node_names)
+            self.assertEqual(node_names[-1], "finalize")
 
     def test_sort_array_alias_array_is_normalized(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -1471,3 +1475,100 @@ def test_tool_node_not_present_for_non_anthropic_path(monkeypatch) -> None:  # n
             f"'tools' ToolNode must NOT be present for non-Anthropic providers. "
             f"Found nodes: {graph_nodes}"
         )
+
+
+def test_fused_step_mode_matches_standard_run(monkeypatch) -> None:  # noqa: ANN001
+    """P1_FUSED_STEP collapses execute/policy into the plan node with identical results."""
+    monkeypatch.setenv("P1_PROVIDER", "scripted")
+    script = [
+        {"action": "tool", "tool_name": "repeat_message", "args": {"message": "hello"}},
+        {"action": "finish", "answer": "done"},
+    ]
+
+    results = {}
+    for fused in ("0", "1"):
+        monkeypatch.setenv("P1_FUSED_STEP", fused)
+        with tempfile.TemporaryDirectory() as tmp:
+            orch = LangGraphOrchestrator(
+                provider=ScriptedProvider(script),
+                memo_store=SQLiteMemoStore(f"{tmp}/memo.db"),
+                checkpoint_store=SQLiteCheckpointStore(f"{tmp}/cp.db"),
+                max_steps=10,
+            )
+            graph_nodes = set(orch._compiled.get_graph().nodes.keys())
+            assert ("execute" in graph_nodes) is (fused == "0")
+            assert ("policy" in graph_nodes) is (fused == "0")
+            results[fused] = orch.run("Task 1: Repeat the message 'hello' using repeat_message.")
+
+    assert results["1"]["answer"] == results["0"]["answer"] == "done"
+    assert [t["tool"] for t in results["1"]["tools_used"]] == ["repeat_message"]
+    assert [t["tool"] for t in results["1"]["tools_used"]] == [
+        t["tool"] for t in results["0"]["tools_used"]
+    ]
+    assert results["1"]["state"]["step"] == results["0"]["state"]["step"]
+
+
+async def test_arun_concurrent_runs_respect_semaphore(monkeypatch) -> None:  # noqa: ANN001
+    """arun() completes concurrent runs independently under P1_MAX_CONCURRENT_RUNS."""
+    import asyncio
+
+    monkeypatch.setenv("P1_PROVIDER", "scripted")
+    monkeypatch.setenv("P1_MAX_CONCURRENT_RUNS", "1")
+    with tempfile.TemporaryDirectory() as tmp:
+        orch = LangGraphOrchestrator(
+            provider=ScriptedProvider([{"action": "finish", "answer": "hi there"}]),
+            memo_store=SQLiteMemoStore(f"{tmp}/memo.db"),
+            checkpoint_store=SQLiteCheckpointStore(f"{tmp}/cp.db"),
+            max_steps=10,
+        )
+        assert orch.max_concurrent_runs == 1
+        results = await asyncio.gather(
+            orch.arun("hello", run_id="arun-a"),
+            orch.arun("hello", run_id="arun-b"),
+        )
+
+    assert [r["run_id"] for r in results] == ["arun-a", "arun-b"]
+    assert all(r["answer"] == "hi there" for r in results)
+    assert all(r["checkpoints"] for r in results)
+
+
+def test_arun_reuses_instance_across_event_loops(monkeypatch) -> None:  # noqa: ANN001
+    """Successive asyncio.run() calls on one orchestrator each get a loop-local limit."""
+    import asyncio
+
+    monkeypatch.setenv("P1_MAX_CONCURRENT_RUNS", "1")
+    with tempfile.TemporaryDirectory() as tmp:
+        orch = LangGraphOrchestrator(
+            provider=ScriptedProvider([{"action": "finish", "answer": "hi there"}]),
+            memo_store=SQLiteMemoStore(f"{tmp}/memo.db"),
+            checkpoint_store=SQLiteCheckpointStore(f"{tmp}/cp.db"),
+            max_steps=10,
+        )
+
+        async def _contended(prefix: str) -> list:
+            return await asyncio.gather(
+                orch.arun("hello", run_id=f"{prefix}-a"),
+                orch.arun("hello", run_id=f"{prefix}-b"),
+            )
+
+        # Both runs wait on the semaphore, which would bind it to the first loop.
+        first = asyncio.run(_contended("loop1"))
+        second = asyncio.run(_contended("loop2"))
+
+    assert [r["run_id"] for r in first + second] == [
+        "loop1-a", "loop1-b", "loop2-a", "loop2-b",
+    ]
+
+
+def test_max_concurrent_runs_is_clamped_to_one(monkeypatch) -> None:  # noqa: ANN001
+    """Sub-1 P1_MAX_CONCURRENT_RUNS never yields a zero-permit semaphore."""
+    with tempfile.TemporaryDirectory() as tmp:
+        for raw, expected in (("0.5", 1), ("1.9", 1), ("0", 4), ("-3", 4)):
+            monkeypatch.setenv("P1_MAX_CONCURRENT_RUNS", raw)
+            orch = LangGraphOrchestrator(
+                provider=ScriptedProvider([{"action": "finish", "answer": "ok"}]),
+                memo_store=SQLiteMemoStore(f"{tmp}/memo.db"),
+                checkpoint_store=SQLiteCheckpointStore(f"{tmp}/cp.db"),
+                max_steps=10,
+            )
+            assert orch.max_concurrent_runs == expected
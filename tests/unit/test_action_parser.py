@@ -36,6 +36,22 @@ class TestActionParser(unittest.TestCase):
         self.assertEqual(parsed["tool_name"], "repeat_message")
         self.assertEqual(parsed["args"]["message"], "ok")
 
+    def test_canonical_fast_path_matches_schema_path(self) -> None:
+        registry = {"repeat_message": object()}
+        tool_output = '{"action":"TOOL","tool_name":"repeat_message","args":{"message":"ok"}}'
+        parsed, _ = action_parser.validate_action(tool_output, registry)
+        self.assertEqual(
+            parsed, {"action": "tool", "tool_name": "repeat_message", "args": {"message": "ok"}}
+        )
+        parsed, _ = action_parser.validate_action('{"action":"finish","answer":"x"}', registry)
+        self.assertEqual(parsed, {"action": "finish", "answer": "x"})
+        with self.assertRaisesRegex(ValueError, "tool schema error"):
+            action_parser.validate_action(
+                '{"action":"tool","tool_name":"repeat_message","args":{},"extra":1}', registry
+            )
+        with self.assertRaisesRegex(ValueError, "finish schema error"):
+            action_parser.validate_action('{"action":"finish","answer":3}', registry)
+
     def test_strip_thinking_removes_scratchpad(self) -> None:
         raw = '<thinking>Let me reason about this.</thinking>{"action":"finish","answer":"ok"}'
         parsed, _ = action_parser.parse_action_json(raw)
@@ -6,7 +6,9 @@ Skipped automatically when DATABASE_URL is not set or psycopg_pool is not instal
 
 from __future__ import annotations
 
+import json
 import os
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -24,6 +26,29 @@ requires_postgres = pytest.mark.skipif(
 )
 
 
+def test_append_messages_without_live_database():
+    """Eviction archiving goes through the pool instead of raising AttributeError."""
+    conn = MagicMock()
+    conn.execute.return_value.fetchone.return_value = (42,)
+    conn.execute.return_value.fetchall.return_value = [
+        (json.dumps([{"role": "user", "content": "a"}]),),
+        (json.dumps([{"role": "assistant", "content": "b"}]),),
+    ]
+    pool = MagicMock()
+    pool.connection.return_value.__enter__.return_value = conn
+    store = PostgresCheckpointStore(pool)
+
+    row_id = store.append_messages(
+        run_id="r1", step=3, messages=[{"role": "user", "content": "a"}]
+    )
+
+    assert row_id == 42
+    sql, params = conn.execute.call_args_list[0].args
+    assert "INSERT INTO message_archive" in sql
+    assert params[:2] == ("r1", 3)
+    assert [m["content"] for m in store.load_archived_messages("r1")] == ["a", "b"]
+
+
 @requires_postgres
 @pytest.mark.postgres
 class TestPostgresCheckpointStore:
@@ -101,4 +126,19 @@ class TestPostgresCheckpointStore:
         store = PostgresCheckpointStore(pg_pool)
         assert store.load_latest("nonexistent-run-id") is None
 
-
+    def test_append_and_load_archived_messages(self, pg_pool, clean_pg):
+        """Archived messages come back per run, oldest first."""
+        store = PostgresCheckpointStore(pg_pool)
+        first = store.append_messages(
+            run_id="run-arch", step=3, messages=[{"role": "user", "content": "a"}]
+        )
+        store.append_messages(
+            run_id="run-arch", step=7, messages=[{"role": "assistant", "content": "b"}]
+        )
+        store.append_messages(
+            run_id="run-other", step=1, messages=[{"role": "user", "content": "x"}]
+        )
+
+        assert first > 0
+        assert [m["content"] for m in store.load_archived_messages("run-arch")] == ["a", "b"]
+        assert store.load_archived_messages("missing") == []
@@ -0,0 +1,108 @@
+"""Tests for SQLiteCheckpointStore per-step write batching."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+
+from agentic_workflows.orchestration.langgraph.checkpoint_store import SQLiteCheckpointStore
+
+
+def _committed_nodes(db_path: str) -> list[str]:
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute("SELECT node_name FROM graph_checkpoints ORDER BY id").fetchall()
+    return [row[0] for row in rows]
+
+
+def test_mid_step_saves_commit_on_next_boundary(tmp_path):
+    db_path = str(tmp_path / "cp.db")
+    store = SQLiteCheckpointStore(db_path)
+    store.save(run_id="r1", step=1, node_name="plan", state={"step": 1})
+    store.save(run_id="r1", step=1, node_name="execute", state={"step": 1})
+    store.save(run_id="r1", step=1, node_name="policy", state={"step": 1})
+    assert _committed_nodes(db_path) == ["plan"]
+
+    store.save(run_id="r1", step=2, node_name="plan", state={"step": 2})
+    assert _committed_nodes(db_path) == ["plan", "execute", "policy", "plan"]
+    store.close()
+
+
+def test_reads_flush_pending_rows(tmp_path):
+    store = SQLiteCheckpointStore(str(tmp_path / "cp.db"))
+    store.save(run_id="r1", step=3, node_name="execute", state={"step": 3, "marker": "x"})
+    assert store.load_latest("r1") == {"marker": "x", "step": 3}
+    assert [cp["node_name"] for cp in store.list_checkpoints("r1")] == ["execute"]
+    store.close()
+
+
+def test_snapshot_is_taken_at_save_time(tmp_path):
+    store = SQLiteCheckpointStore(str(tmp_path / "cp.db"))
+    state = {"step": 1, "messages": []}
+    store.save(run_id="r1", step=1, node_name="execute", state=state)
+    state["messages"].append({"role": "user", "content": "later"})
+    assert store.load_latest("r1")["messages"] == []
+    store.close()
+
+
+def _raw_states(db_path: str) -> list[dict]:
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute("SELECT state_json FROM graph_checkpoints ORDER BY id").fetchall()
+    return [json.loads(row[0]) for row in rows]
+
+
+def test_appended_messages_are_stored_as_deltas(tmp_path):
+    db_path = str(tmp_path / "cp.db")
+    store = SQLiteCheckpointStore(db_path)
+    messages = [{"role": "system", "content": "sys"}]
+    state = {"step": 0, "messages": messages}
+    store.save(run_id="r1", step=0, node_name="init", state=state)
+    for step in range(1, 4):
+        messages.append({"role": "user", "content": f"m{step}"})
+        state["step"] = step
+        store.save(run_id="r1", step=step, node_name="plan", state=state)
+
+    raw = _raw_states(db_path)
+    assert "messages" in raw[0]
+    assert all("messages" not in row for row in raw[1:])
+    assert raw[3]["list_deltas"]["messages"] == {
+        "base": 3,
+        "tail": [{"role": "user", "content": "m3"}],
+    }
+    assert store.load_latest("r1")["messages"] == messages
+    assert store.load_latest_run()["messages"] == messages
+    store.close()
+
+
+def test_rewritten_history_forces_snapshot(tmp_path):
+    db_path = str(tmp_path / "cp.db")
+    store = SQLiteCheckpointStore(db_path)
+    head = {"role": "system", "content": "sys"}
+    state = {"step": 0, "messages": [head, {"role": "user", "content": "a"}]}
+    store.save(run_id="r1", step=0, node_name="init", state=state)
+    state["messages"] = [head, {"role": "user", "content": "b"}, {"role": "user", "content": "c"}]
+    store.save(run_id="r1", step=1, node_name="plan", state=state)
+
+    assert "messages" in _raw_states(db_path)[1]
+    assert store.load_latest("r1")["messages"] == state["messages"]
+    store.close()
+
+
+def test_unfinished_runs_do_not_leak_delta_marks(tmp_path, monkeypatch):
+    from agentic_workflows.orchestration.langgraph import checkpoint_store
+
+    monkeypatch.setattr(checkpoint_store, "_MAX_TRACKED_RUNS", 2)
+    db_path = str(tmp_path / "cp.db")
+    store = SQLiteCheckpointStore(db_path)
+    messages = [{"role": "system", "content": "sys"}]
+    # Three runs that never reach finalize (errored/abandoned).
+    for run_id in ("r1", "r2", "r3"):
+        store.save(run_id=run_id, step=0, node_name="init", state={"messages": messages})
+    assert list(store._list_marks) == ["r2", "r3"]
+    assert "r1" not in store._saves_since_snapshot
+
+    # An evicted run that comes back is stored in full, and still reads back correctly.
+    messages.append({"role": "user", "content": "more"})
+    store.save(run_id="r1", step=1, node_name="plan", state={"messages": messages})
+    assert "messages" in _raw_states(db_path)[-1]
+    assert store.load_latest("r1")["messages"] == messages
+    store.close()
@@ -0,0 +1,60 @@
+"""Unit tests for content_validator Fibonacci write checks."""
+
+from __future__ import annotations
+
+from agentic_workflows.orchestration.langgraph import content_validator
+from agentic_workflows.orchestration.langgraph.content_validator import (
+    validate_tool_result_for_active_mission,
+)
+from agentic_workflows.orchestration.langgraph.text_extractor import fibonacci_csv
+
+
+def _validate(content: str, count: int = 100) -> str | None:
+    state = {
+        "mission_reports": [
+            {"mission": f"Write the first {count} fibonacci numbers to fib.txt",
+             "expected_fibonacci_count": count}
+        ],
+        "active_mission_index": 0,
+    }
+    return validate_tool_result_for_active_mission(
+        state=state,
+        tool_name="write_file",
+        tool_args={"path": "fib.txt", "content": content},
+        tool_result={"result": "ok"},
+    )
+
+
+def test_canonical_sequence_passes():
+    assert _validate(fibonacci_csv(100)) is None
+
+
+def test_first_mismatch_index_is_reported():
+    numbers = fibonacci_csv(10).split(",")
+    numbers[6] = "9"
+    error = _validate(",".join(numbers), count=10)
+    assert error == "fibonacci sequence mismatch at index 6: got 9, expected 8."
+
+
+def test_wrong_count_and_prefix_are_rejected():
+    assert "exactly 100 integers" in (_validate(fibonacci_csv(99)) or "")
+    assert _validate("1,1,2", count=3) == "fibonacci content must start with 0, 1."
+
+
+def test_identical_content_is_validated_once(monkeypatch):
+    calls = []
+    real_check = content_validator._check_fibonacci_content
+
+    def counting_check(content, expected_count):
+        calls.append(expected_count)
+        return real_check(content, expected_count)
+
+    monkeypatch.setattr(content_validator, "_check_fibonacci_content", counting_check)
+    monkeypatch.setattr(content_validator, "_fib_cache", type(content_validator._fib_cache)())
+    content = fibonacci_csv(20)
+    assert _validate(content, count=20) is None
+    assert _validate(content, count=20) is None
+    assert calls == [20]
+    # Keyed on a 16-byte digest, so the cache never holds the content itself.
+    [(digest, count)] = content_validator._fib_cache
+    assert (len(digest), count) == (16, 20)
@@ -30,6 +30,84 @@ def test_compact_sliding_window_enforced():
     assert state["messages"][-1]["content"] == "msg-19"
 
 
+def test_compact_evicts_later_system_messages_and_returns_them():
+    """Tool-result system turns age out like any other turn and are returned."""
+    cm = ContextManager(sliding_window_cap=4)
+    messages = [{"role": "system", "content": "prompt"}]
+    messages += [{"role": "system", "content": f"TOOL_RESULT #{i}"} for i in range(6)]
+    state = _state_with_messages(messages)
+    evicted = cm.compact(state)
+    assert [m["content"] for m in state["messages"]] == [
+        "prompt", "TOOL_RESULT #3", "TOOL_RESULT #4", "TOOL_RESULT #5",
+    ]
+    assert [m["content"] for m in evicted] == ["TOOL_RESULT #0", "TOOL_RESULT #1", "TOOL_RESULT #2"]
+
+
+def test_compact_pins_prompt_and_request_only():
+    """The system prompt and original request survive; transient notes age out."""
+    cm = ContextManager(sliding_window_cap=5)
+    messages = [
+        {"role": "system", "content": "prompt"},
+        {"role": "user", "content": "original request"},
+        {"role": "system", "content": "TOOL_RESULT #1 (sort_array): [1]"},
+        {"role": "system", "content": "Finish rejected: missions remain incomplete."},
+        {"role": "system", "content": "[tool_result: read_file, 900 chars, stored in context]"},
+    ]
+    messages += [{"role": "assistant", "content": f"turn-{i}"} for i in range(3)]
+    state = _state_with_messages(messages)
+    evicted = cm.compact(state)
+    assert [m["content"] for m in state["messages"]] == [
+        "prompt", "original request", "turn-0", "turn-1", "turn-2",
+    ]
+    assert [m["content"] for m in evicted] == [
+        "TOOL_RESULT #1 (sort_array): [1]",
+        "Finish rejected: missions remain incomplete.",
+        "[tool_result: read_file, 900 chars, stored in context]",
+    ]
+
+
+def test_compact_stays_bounded_during_note_producing_loop():
+    """A long duplicate-call loop never grows the window past the cap."""
+    cm = ContextManager(sliding_window_cap=20)
+    state = _state_with_messages(
+        [{"role": "system", "content": "prompt"}, {"role": "user", "content": "request"}]
+    )
+    for step in range(60):
+        state["messages"].append({"role": "assistant", "content": f"call-{step}"})
+        state["messages"].append(
+            {"role": "system", "content": "Duplicate tool call detected for 'sort_array'."}
+        )
+        cm.compact(state)
+        assert len(state["messages"]) <= 20
+    assert [m["content"] for m in state["messages"][:2]] == ["prompt", "request"]
+
+
+def test_proactive_compact_keeps_original_request():
+    """Aggressive compaction still keeps the user's request alongside the newest turns."""
+    cm = ContextManager(sliding_window_cap=100)
+    messages = [{"role": "system", "content": "prompt"}, {"role": "user", "content": "req"}]
+    messages += [{"role": "assistant", "content": "y" * 500} for _ in range(50)]
+    state = _state_with_messages(messages)
+    evicted = cm.proactive_compact(state, ctx_limit=2000)
+    assert [m["content"] for m in state["messages"][:2]] == ["prompt", "req"]
+    assert len(state["messages"]) == 6
+    assert len(evicted) == 46
+
+
+def test_checkpoint_store_archives_evicted_messages(tmp_path):
+    """Evicted messages round-trip through the checkpoint store archive in order."""
+    from agentic_workflows.orchestration.langgraph.checkpoint_store import SQLiteCheckpointStore
+
+    store = SQLiteCheckpointStore(str(tmp_path / "cp.db"))
+    first = store.append_messages(run_id="r1", step=3, messages=[{"role": "user", "content": "a"}])
+    store.append_messages(run_id="r1", step=7, messages=[{"role": "system", "content": "b"}])
+    store.append_messages(run_id="r2", step=1, messages=[{"role": "user", "content": "x"}])
+    assert first > 0
+    assert [m["content"] for m in store.load_archived_messages("r1")] == ["a", "b"]
+    assert store.load_archived_messages("missing") == []
+    store.close()
+
+
 def test_on_tool_result_replaces_large_result():
     """on_tool_result() replaces messages with content > threshold with placeholders.
 
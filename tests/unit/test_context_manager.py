@@ -441,7 +441,7 @@ class TestSlidingWindowCap:
         state = _make_state(messages=messages)
         cm.compact(state)
 
-        # Should have system prompt + 9 newest = 10 total
+        # Should have system prompt + original request + 8 newest = 10 total
         assert len(state["messages"]) == 10
         assert state["messages"][0]["role"] == "system"
         assert state["messages"][0]["content"] == "sys"
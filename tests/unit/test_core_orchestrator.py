@@ -0,0 +1,107 @@
+"""Tests for core/orchestrator.py — legacy Orchestrator LLM message view and arun()."""
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from agentic_workflows.core.agent_state import AgentState
+from agentic_workflows.core.orchestrator import Orchestrator
+
+
+def make_orchestrator() -> Orchestrator:
+    with patch("agentic_workflows.core.orchestrator.LLMProvider", return_value=MagicMock()):
+        return Orchestrator()
+
+
+def make_state(extra_turns: int) -> AgentState:
+    state = AgentState(
+        messages=[{"role": "system", "content": "sys"}, {"role": "user", "content": "task"}]
+    )
+    for i in range(extra_turns):
+        state.add_message("assistant", f"turn {i}")
+    return state
+
+
+def test_short_transcript_is_sent_unchanged():
+    orch = make_orchestrator()
+    state = make_state(orch.history_window)
+    assert orch._llm_messages(state, []) is state.messages
+
+
+def test_long_transcript_keeps_request_summary_and_tail():
+    orch = make_orchestrator()
+    state = make_state(10)
+    tools_used = [{"call": 1, "tool": "sort_array", "args": {}, "result": "{'sorted': [1]}"}]
+
+    view = orch._llm_messages(state, tools_used)
+
+    assert view[:2] == state.messages[:2]
+    assert "4 earlier message(s) omitted" in view[2]["content"]
+    assert "#1 sort_array → {'sorted': [1]}" in view[2]["content"]
+    assert view[3:] == state.messages[-orch.history_window :]
+    assert len(state.messages) == 12
+
+
+def test_zero_window_disables_trimming():
+    orch = make_orchestrator()
+    orch.history_window = 0
+    state = make_state(30)
+    assert orch._llm_messages(state, []) is state.messages
+
+
+class ScriptedProvider:
+    """Calls one tool, then finishes once a TOOL_RESULT is in the transcript.
+
+    Decides from the messages alone, so one instance serves concurrent runs;
+    records the peak number of overlapping generate() calls.
+    """
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def generate(self, messages):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)
+            if any(str(m["content"]).startswith("TOOL_RESULT") for m in messages):
+                return json.dumps({"action": "finish", "answer": "done"})
+            return json.dumps(
+                {"action": "tool", "tool_name": "repeat_message", "args": {"message": "hi"}}
+            )
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def test_arun_returns_same_result_as_run():
+    orch = make_orchestrator()
+    orch.llm = ScriptedProvider()
+
+    sync_result = orch.run("say hi")
+    async_result = asyncio.run(orch.arun("say hi"))
+
+    assert async_result == sync_result
+    assert async_result["action"] == "finish"
+    assert [entry["tool"] for entry in async_result["tools_used"]] == ["repeat_message"]
+
+
+def test_arun_applies_concurrency_limit():
+    orch = make_orchestrator()
+    orch.llm = ScriptedProvider(delay=0.05)
+    orch.max_concurrent_runs = 2
+
+    async def _main():
+        return await asyncio.gather(*(orch.arun(f"say hi {i}") for i in range(5)))
+
+    results = asyncio.run(_main())
+
+    assert [r["answer"] for r in results] == ["done"] * 5
+    assert orch.llm.peak == 2
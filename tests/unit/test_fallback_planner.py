@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import unittest
 
 from agentic_workflows.orchestration.langgraph.fallback_planner import (
     deterministic_fallback_action,
     normalize_tool_args,
 )
+from agentic_workflows.orchestration.langgraph.state_schema import tool_signature
 
 
 def _pending_state(mission: str, required_tools: list[str] | None = None) -> dict:
@@ -167,7 +167,7 @@ class TestDeterministicFallbackRepeatMessage(unittest.TestCase):
     def test_repeat_message_skipped_when_duplicate(self) -> None:
         state = _pending_state('Repeat the message "hello world"', ["repeat_message"])
         # Pre-populate seen signatures with the repeat_message action
-        sig = 'repeat_message:' + json.dumps({"message": "hello world"}, sort_keys=True)
+        sig = tool_signature("repeat_message", {"message": "hello world"})
         state["seen_tool_signatures"] = [sig]
         # Should fall through to None (no other path matches)
         action = deterministic_fallback_action(state)
@@ -224,7 +224,7 @@ class TestDeterministicFallbackStringOps(unittest.TestCase):
 
     def test_string_ops_duplicate_skipped_falls_to_none(self) -> None:
         state = _pending_state('Uppercase the text "hello"', ["string_ops"])
-        sig = 'string_ops:' + json.dumps({"operation": "uppercase", "text": "hello"}, sort_keys=True)
+        sig = tool_signature("string_ops", {"operation": "uppercase", "text": "hello"})
         state["seen_tool_signatures"] = [sig]
         action = deterministic_fallback_action(state)
         # Lowercase and reverse don't match "uppercase" mission → falls through
@@ -401,6 +401,17 @@ class TestNormalizeToolArgs(unittest.TestCase):
         result = normalize_tool_args("unknown_tool", {"foo": "bar"})
         assert result == {"foo": "bar"}
 
+    # Copy-on-write: input is never mutated, unchanged args are returned as-is
+    def test_no_alias_returns_same_object(self) -> None:
+        args = {"items": [1, 2]}
+        assert normalize_tool_args("sort_array", args) is args
+
+    def test_alias_does_not_mutate_input(self) -> None:
+        args = {"array": [3, 1]}
+        result = normalize_tool_args("sort_array", args)
+        assert result == {"items": [3, 1]}
+        assert args == {"array": [3, 1]}
+
 
 if __name__ == "__main__":
     unittest.main()
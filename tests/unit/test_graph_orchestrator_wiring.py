@@ -90,3 +90,68 @@ def test_orchestrator_forwards_artifact_store():
     mock_store = MagicMock()
     orchestrator = LangGraphOrchestrator(artifact_store=mock_store)
     assert orchestrator.context_manager._artifact_store is mock_store
+
+
+def test_tool_name_views_match_registry():
+    """Precomputed tool-name set/string must mirror the live tool registry."""
+    orchestrator = LangGraphOrchestrator()
+    assert orchestrator._tool_name_set == frozenset(orchestrator.tools)
+    assert orchestrator._tool_names_joined == ", ".join(orchestrator.tools)
+
+
+def test_unrecoverable_plan_error_detection():
+    """Marker regex keeps the model+not-found pairing and is case-insensitive."""
+    orchestrator = LangGraphOrchestrator()
+    check = orchestrator._is_unrecoverable_plan_error
+    assert check("Error: Model 'llama9' NOT FOUND")
+    assert check("404 not found: requested model missing")
+    assert check("Invalid API key provided")
+    assert check("insufficient_quota for this org")
+    assert check("Rate limit exceeded, slow down")
+    assert not check("file not found")
+    assert not check("model returned malformed JSON")
+
+
+def test_plan_cache_reuses_output_for_identical_messages(monkeypatch):
+    """P1_PLAN_CACHE_SIZE enables an LRU over planner outputs; 0 keeps it off."""
+    monkeypatch.setenv("P1_PLAN_CACHE_SIZE", "1")
+    orchestrator = LangGraphOrchestrator(plan_call_timeout_seconds=0)
+    provider = MagicMock()
+    provider.generate.side_effect = ["first", "second", "third"]
+    orchestrator._router.route_by_signals = lambda signals: provider
+    messages_a = [{"role": "user", "content": "a"}]
+    messages_b = [{"role": "user", "content": "b"}]
+
+    assert orchestrator._generate_with_hard_timeout(messages_a, signals=None) == "first"
+    assert orchestrator._generate_with_hard_timeout(list(messages_a), signals=None) == "first"
+    assert orchestrator._generate_with_hard_timeout(messages_b, signals=None) == "second"
+    # Capacity 1: messages_a was evicted by messages_b.
+    assert orchestrator._generate_with_hard_timeout(messages_a, signals=None) == "third"
+    assert provider.generate.call_count == 3
+
+
+def test_plan_cache_is_keyed_on_provider_config_not_identity(monkeypatch):
+    """Cache entries follow provider type/model/base_url, never id(provider)."""
+
+    class _StubProvider:
+        def __init__(self, model: str, output: str) -> None:
+            self.model = model
+            self.base_url = "http://host:11434/v1"
+            self.output = output
+
+        def generate(self, messages, response_schema=None):  # noqa: ANN001, ANN201, ARG002
+            return self.output
+
+    monkeypatch.setenv("P1_PLAN_CACHE_SIZE", "8")
+    orchestrator = LangGraphOrchestrator(plan_call_timeout_seconds=0)
+    messages = [{"role": "user", "content": "a"}]
+
+    def _plan_with(provider: _StubProvider) -> str:
+        orchestrator._router.route_by_signals = lambda signals: provider  # noqa: ARG005
+        return orchestrator._generate_with_hard_timeout(messages, signals=None)
+
+    assert _plan_with(_StubProvider("m1", "from-m1")) == "from-m1"
+    # Another model never sees m1's plan, even if it were allocated at a reused id.
+    assert _plan_with(_StubProvider("m2", "from-m2")) == "from-m2"
+    # A distinct instance with the same configuration shares the entry.
+    assert _plan_with(_StubProvider("m1", "fresh")) == "from-m1"
@@ -6,7 +6,7 @@ import os
 from unittest.mock import MagicMock, patch
 
 
-@patch("agentic_workflows.orchestration.langgraph.provider.OpenAI")
+@patch("openai.OpenAI")
 @patch(
     "agentic_workflows.orchestration.langgraph.provider._detect_llama_cpp_model",
     return_value="base-model",
@@ -88,7 +88,7 @@ class TestLlamaCppWithAlias:
         assert alias_a.client is alias_b.client  # both share source client
 
 
-@patch("agentic_workflows.orchestration.langgraph.provider.OpenAI")
+@patch("openai.OpenAI")
 @patch(
     "agentic_workflows.orchestration.langgraph.provider._detect_llama_cpp_model",
     return_value="Qwen3-8B-Q4_K_M.gguf",
@@ -129,7 +129,7 @@ class TestLlamaCppGrammarAutoDetect:
         assert provider._grammar_enabled is False
 
 
-@patch("agentic_workflows.orchestration.langgraph.provider.OpenAI")
+@patch("openai.OpenAI")
 @patch(
     "agentic_workflows.orchestration.langgraph.provider._detect_llama_cpp_model",
     return_value="Qwen2.5-7B-Instruct-Q4_K_M.gguf",
@@ -5,7 +5,7 @@ import logging
 import pytest
 
 import agentic_workflows.logger as logger_mod
-from agentic_workflows.logger import _ADMIN_PREFIXES, AdminFilter, setup_dual_logging
+from agentic_workflows.logger import _ADMIN_PREFIXES, AdminFilter, LazyTrunc, setup_dual_logging
 
 
 @pytest.fixture(autouse=True)
@@ -56,6 +56,20 @@ class TestAdminFilter:
         assert f.filter(record) is False
 
 
+class TestLazyTrunc:
+    def test_truncates_on_format(self):
+        assert str(LazyTrunc("abcdef", 3)) == "abc"
+
+    def test_short_text_unchanged(self):
+        assert str(LazyTrunc("ab", 10)) == "ab"
+
+    def test_record_message_is_truncated(self):
+        record = logging.LogRecord(
+            "test", logging.INFO, "", 0, "MODEL OUTPUT %s", (LazyTrunc("x" * 50, 5),), None
+        )
+        assert record.getMessage() == "MODEL OUTPUT xxxxx"
+
+
 class TestSetupDualLogging:
     def test_creates_both_files(self, _reset_logging_state):
         tmp = _reset_logging_state
@@ -53,6 +53,18 @@ class TestPostgresMemoStore:
         assert result.found is True
         assert result.value == {"v": 2}
 
+    def test_put_unchanged_value_keeps_provenance(self, pg_pool, clean_pg):
+        """Re-putting an identical value is a no-op that keeps the first step/source."""
+        store = PostgresMemoStore(pg_pool)
+        assert store.put(run_id="run-p", key="k1", value={"v": 1}, step=1).inserted is True
+        again = store.put(
+            run_id="run-p", key="k1", value={"v": 1}, source_tool="write_file", step=4
+        )
+
+        assert again.inserted is False
+        [entry] = store.list_entries(run_id="run-p")
+        assert (entry["step"], entry["source_tool"]) == (1, "memoize")
+
     def test_get_returns_not_found_for_missing_key(self, pg_pool, clean_pg):
         """get returns found=False for a key that does not exist."""
         store = PostgresMemoStore(pg_pool)
@@ -23,6 +23,45 @@ class MemoStoreTests(unittest.TestCase):
             self.assertEqual(lookup.value["n"], 100)
             self.assertEqual(result.value_hash, lookup.value_hash)
 
+    def test_put_hash_matches_hash_json(self) -> None:
+        from agentic_workflows.orchestration.langgraph.state_schema import hash_json
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = SQLiteMemoStore(f"{temp_dir}/memo.db")
+            value = {"b": [3, 1], "a": {"nested": True}}
+            result = store.put(run_id="run-1", key="k", value=value)
+            self.assertEqual(result.value_hash, hash_json(value))
+            store.close()
+
+    def test_unchanged_value_put_is_not_rewritten(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = SQLiteMemoStore(f"{temp_dir}/memo.db")
+            first = store.put(run_id="run-1", key="k", value={"v": 1}, step=1)
+            again = store.put(
+                run_id="run-1", key="k", value={"v": 1}, source_tool="write_file", step=2
+            )
+            self.assertTrue(first.inserted)
+            self.assertFalse(again.inserted)
+            # Provenance deliberately stays with the put that first stored the value.
+            [entry] = store.list_entries(run_id="run-1")
+            self.assertEqual((entry["step"], entry["source_tool"]), (1, "memoize"))
+            changed = store.put(run_id="run-1", key="k", value={"v": 2}, step=3)
+            self.assertTrue(changed.inserted)
+            self.assertEqual(store.get(run_id="run-1", key="k").value, {"v": 2})
+            store.close()
+
+    def test_put_many_writes_all_keys_with_one_hash(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = SQLiteMemoStore(f"{temp_dir}/memo.db")
+            results = store.put_many(
+                run_id="shared", keys=["a", "b"], value={"v": 1}, namespace="cache"
+            )
+            self.assertEqual([r.key for r in results], ["a", "b"])
+            self.assertTrue(all(r.inserted for r in results))
+            self.assertEqual(len({r.value_hash for r in results}), 1)
+            self.assertEqual(store.get(run_id="shared", key="b", namespace="cache").value, {"v": 1})
+            store.close()
+
     def test_run_scoped_lookup(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             db_path = f"{temp_dir}/memo.db"
@@ -31,6 +70,37 @@ class MemoStoreTests(unittest.TestCase):
             lookup = store.get(run_id="run-b", key="k")
             self.assertFalse(lookup.found)
 
+    def test_persistent_connection_uses_wal_and_is_visible_to_other_readers(self) -> None:
+        import sqlite3
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = f"{temp_dir}/memo.db"
+            store = SQLiteMemoStore(db_path)
+            mode = store._conn.execute("PRAGMA journal_mode").fetchone()[0]
+            self.assertEqual(mode, "wal")
+            store.put(run_id="run-1", key="k", value={"v": 1})
+            self.assertEqual(store.delete(run_id="run-1", key="missing"), 0)
+            # Writes are committed, so an independent connection sees them.
+            with sqlite3.connect(db_path) as reader:
+                count = reader.execute("SELECT COUNT(*) FROM memo_entries").fetchone()[0]
+            self.assertEqual(count, 1)
+            store.close()
+
+    def test_list_entries_returns_plain_dicts_in_step_order(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = SQLiteMemoStore(f"{temp_dir}/memo.db")
+            store.put(run_id="run-1", key="b", value=2, step=2, created_at="t2")
+            store.put(run_id="run-1", key="a", value=1, step=1, created_at="t1")
+            entries = store.list_entries(run_id="run-1")
+            self.assertEqual([entry["key"] for entry in entries], ["a", "b"])
+            self.assertEqual(
+                set(entries[0]), {"key", "value_hash", "source_tool", "step", "created_at"}
+            )
+            self.assertEqual((entries[0]["step"], entries[0]["created_at"]), (1, "t1"))
+            # The shared connection keeps Row access for the other queries.
+            self.assertEqual(store.get(run_id="run-1", key="a").value, 1)
+            store.close()
+
 
 if __name__ == "__main__":
     unittest.main()
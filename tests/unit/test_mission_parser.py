@@ -7,8 +7,10 @@ from agentic_workflows.orchestration.langgraph.mission_parser import (
     MissionStep,
     StructuredPlan,
     _classify_intent,
+    _Deadline,
     _deterministic_classify,
     _extract_missions_regex_fallback,
+    _parse_missions_inner,
     parse_missions,
 )
 
@@ -71,6 +73,26 @@ class MissionParserTests(unittest.TestCase):
         self.assertEqual(len(top_level), 2)
         self.assertIn("ascending order", top_level[0].description)
 
+    def test_continuation_follows_its_own_line(self) -> None:
+        text = (
+            "  stray indented note\n"
+            "Task 1: Repeat hello\n"
+            "Task 2: Repeat hello\n"
+            "  then uppercase it\n"
+            "  1a. sub of one\n"
+            "  with more detail"
+        )
+        plan = parse_missions(text)
+        by_order = [(s.id, s.description) for s in plan.steps]
+        self.assertEqual(
+            by_order,
+            [
+                ("1", "Repeat hello"),
+                ("2", "Repeat hello then uppercase it"),
+                ("1a", "sub of one with more detail"),
+            ],
+        )
+
     def test_tool_suggestion_heuristics(self) -> None:
         text = "Task 1: sort the numbers\nTask 2: write to output file\nTask 3: analyze the text"
         plan = parse_missions(text)
@@ -86,6 +108,13 @@ class MissionParserTests(unittest.TestCase):
         self.assertEqual(plan.parsing_method, "regex_fallback")
         self.assertEqual(plan.flat_missions, ["Primary mission"])
 
+    def test_expired_deadline_uses_fallback_plan(self) -> None:
+        text = "Task 1: Sort the array\nTask 2: Write to file"
+        with self.assertRaises(TimeoutError):
+            _parse_missions_inner(text, _Deadline(time.monotonic() - 1))
+        plan = parse_missions(text, timeout_seconds=1e-9)
+        self.assertEqual(plan.parsing_method, "regex_fallback")
+
     def test_flat_missions_backward_compat(self) -> None:
         text = "Task 1: Do thing A\nTask 2: Do thing B\nTask 3: Do thing C"
         plan = parse_missions(text)
@@ -51,3 +51,17 @@ def test_ollama_generate_has_observe_decorator():
         "@observe() was either removed or not applied. "
         "functools.wraps sets __wrapped__ on both the real decorator and the no-op passthrough."
     )
+
+
+def test_get_langfuse_client_resolves_unconfigured_once(monkeypatch):
+    """The unavailable result is memoized; env is not re-read on later calls."""
+    from agentic_workflows import observability
+
+    monkeypatch.setattr(observability, "_langfuse_client", None)
+    monkeypatch.setattr(observability, "_langfuse_client_resolved", False)
+    calls = []
+    monkeypatch.setattr(observability, "_is_configured", lambda: calls.append(1) or False)
+
+    assert observability.get_langfuse_client() is None
+    assert observability.get_langfuse_client() is None
+    assert len(calls) == (1 if observability._langfuse_available else 0)
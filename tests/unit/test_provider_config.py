@@ -1,17 +1,58 @@
 import os
+import tempfile
 import unittest
 from unittest.mock import Mock, patch
 
+import httpx
+import openai
+
+from agentic_workflows.core.llm_provider import LLMProvider
 from agentic_workflows.core.llm_provider import _resolve_ollama_base_url as p0_resolve
+from agentic_workflows.http_client import shared_http_client
 from agentic_workflows.orchestration.langgraph.provider import (
     OllamaChatProvider,
     _resolve_ollama_native_chat_url,
+    build_provider,
 )
 from agentic_workflows.orchestration.langgraph.provider import (
     _resolve_ollama_base_url as p1_resolve,
 )
 
 
+def _status_error(
+    cls: type[openai.APIStatusError], status: int, message: str = "error"
+) -> openai.APIStatusError:
+    request = httpx.Request("POST", "http://localhost/v1/chat/completions")
+    return cls(message, response=httpx.Response(status, request=request), body=None)
+
+
+_JSON_MODE_REJECTED = "response_format json_object is not supported"
+
+
+def _json_mode_client(error: Exception, *, fail_once: bool = False) -> Mock:
+    """SDK client mock whose JSON-mode requests raise *error*; plain requests succeed."""
+    response = Mock()
+    response.choices = [Mock(message=Mock(content="plain"))]
+    raised: list[Exception] = []
+
+    def _create(**kwargs):  # noqa: ANN003, ANN202
+        if "response_format" in kwargs and not (fail_once and raised):
+            raised.append(error)
+            raise error
+        return response
+
+    client = Mock()
+    client.chat.completions.create.side_effect = _create
+    return client
+
+
+def _json_mode_calls(client: Mock) -> int:
+    return sum(
+        "response_format" in call.kwargs
+        for call in client.chat.completions.create.call_args_list
+    )
+
+
 class ProviderConfigTests(unittest.TestCase):
     def test_explicit_base_url_wins(self) -> None:
         with patch.dict(os.environ, {"OLLAMA_BASE_URL": "http://env:11434/v1"}, clear=True):
@@ -66,7 +107,7 @@ class ProviderConfigTests(unittest.TestCase):
                 "agentic_workflows.orchestration.langgraph.provider.httpx.Client",
                 return_value=native_client,
             ),
-            patch("agentic_workflows.orchestration.langgraph.provider.OpenAI") as openai_client,
+            patch("openai.OpenAI") as openai_client,
         ):
             provider = OllamaChatProvider(model="qwen-test", base_url="http://host:11434/v1")
             result = provider.generate([{"role": "user", "content": "hello"}])
@@ -102,7 +143,7 @@ class ProviderConfigTests(unittest.TestCase):
                 clear=True,
             ),
             patch(
-                "agentic_workflows.orchestration.langgraph.provider.OpenAI",
+                "openai.OpenAI",
                 return_value=compat_client,
             ),
             patch(
@@ -120,6 +161,107 @@ class ProviderConfigTests(unittest.TestCase):
             {"options": {"num_ctx": 8192}},
         )
 
+    def test_build_provider_shares_http_pool_not_provider_instances(self) -> None:
+        env = {"P1_PROVIDER": "openai", "OPENAI_API_KEY": "test-key", "OPENAI_MODEL": "m1"}
+        with (
+            patch.dict(os.environ, env, clear=True),
+            patch("openai.OpenAI") as client_cls,
+        ):
+            first = build_provider()
+            os.environ["OPENAI_MODEL"] = "m2"
+            second = build_provider("openai")
+        self.assertIsNot(first, second)
+        self.assertEqual((first.model, second.model), ("m1", "m2"))
+        pools = {id(call.kwargs["http_client"]) for call in client_cls.call_args_list}
+        self.assertEqual(pools, {id(shared_http_client())})
+
+    def test_legacy_provider_replays_cached_completion(self) -> None:
+        response = Mock()
+        response.choices = [Mock(message=Mock(content='{"answer":"ok"}'))]
+        client = Mock()
+        client.chat.completions.create.return_value = response
+        with tempfile.TemporaryDirectory() as tmp:
+            env = {"LLM_RESPONSE_CACHE_PATH": os.path.join(tmp, "llm_cache.db")}
+            with (
+                patch.dict(os.environ, env, clear=True),
+                patch("agentic_workflows.core.llm_provider.OpenAI", return_value=client),
+            ):
+                provider = LLMProvider(provider="ollama", model="qwen-test")
+                messages = [{"role": "user", "content": "hello"}]
+                self.assertEqual(provider.generate(messages), '{"answer":"ok"}')
+                self.assertEqual(provider.generate(list(messages)), '{"answer":"ok"}')
+                provider.generate(messages, no_cache=True)
+        self.assertEqual(client.chat.completions.create.call_count, 2)
+
+    def _run_json_mode_probe(
+        self, client: Mock, *, legacy: bool, base_url: str = "http://host:11434/v1"
+    ) -> None:
+        """Generate twice through one Ollama stack with *client* as its SDK client."""
+        target = "agentic_workflows.core.llm_provider.OpenAI" if legacy else "openai.OpenAI"
+        with (
+            patch.dict(os.environ, {}, clear=True),
+            patch(target, return_value=client),
+        ):
+            if legacy:
+                provider = LLMProvider(provider="ollama", model="qwen-test", base_url=base_url)
+            else:
+                provider = OllamaChatProvider(model="qwen-test", base_url=base_url)
+            for content in ("a", "b"):
+                self.assertEqual(provider.generate([{"role": "user", "content": content}]), "plain")
+
+    def test_json_mode_rejection_is_remembered_per_endpoint(self) -> None:
+        for legacy in (True, False):
+            with (
+                self.subTest(legacy=legacy),
+                patch("agentic_workflows.json_mode._UNSUPPORTED", set()),
+            ):
+                rejected = _json_mode_client(
+                    _status_error(openai.BadRequestError, 400, _JSON_MODE_REJECTED)
+                )
+                self._run_json_mode_probe(rejected, legacy=legacy)
+                # Second call skips the known-failing JSON-mode round-trip.
+                self.assertEqual(_json_mode_calls(rejected), 1)
+                self.assertEqual(rejected.chat.completions.create.call_count, 3)
+
+                # Same model on another server is probed independently.
+                other = _json_mode_client(
+                    _status_error(openai.BadRequestError, 400, _JSON_MODE_REJECTED)
+                )
+                self._run_json_mode_probe(other, legacy=legacy, base_url="http://other:11434/v1")
+                self.assertEqual(_json_mode_calls(other), 1)
+
+    def test_unrelated_errors_keep_json_mode(self) -> None:
+        errors = [
+            _status_error(openai.BadRequestError, 400, "prompt exceeds the context length"),
+            _status_error(openai.RateLimitError, 429),
+            _status_error(openai.InternalServerError, 500),
+        ]
+        for legacy in (True, False):
+            for error in errors:
+                with (
+                    self.subTest(legacy=legacy, status=error.status_code),
+                    patch("agentic_workflows.json_mode._UNSUPPORTED", set()) as unsupported,
+                ):
+                    client = _json_mode_client(error, fail_once=True)
+                    self._run_json_mode_probe(client, legacy=legacy)
+                    self.assertEqual(unsupported, set())
+                    self.assertEqual(_json_mode_calls(client), 2)
+
+    def test_legacy_sdk_clients_keep_their_default_timeouts(self) -> None:
+        import groq
+        import openai
+
+        with patch.dict(os.environ, {"GROQ_API_KEY": "k", "OPENAI_API_KEY": "k"}, clear=True):
+            ollama = LLMProvider(provider="ollama", model="m")
+            openai_provider = LLMProvider(provider="openai", model="m")
+            groq_provider = LLMProvider(provider="groq", model="m")
+        self.assertEqual(ollama.client.timeout, openai.DEFAULT_TIMEOUT)
+        self.assertEqual(openai_provider.client.timeout, openai.DEFAULT_TIMEOUT)
+        self.assertEqual(groq_provider.client.timeout, groq.DEFAULT_TIMEOUT)
+        # One process-wide pool, shared with the LangGraph providers.
+        for provider in (ollama, openai_provider, groq_provider):
+            self.assertIs(provider.client._client, shared_http_client())
+
 
 if __name__ == "__main__":
     unittest.main()
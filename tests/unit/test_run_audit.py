@@ -3,7 +3,7 @@ import unittest
 
 from agentic_workflows.orchestration.langgraph.checkpoint_store import SQLiteCheckpointStore
 from agentic_workflows.orchestration.langgraph.memo_store import SQLiteMemoStore
-from agentic_workflows.orchestration.langgraph.run_audit import summarize_runs
+from agentic_workflows.orchestration.langgraph.run_audit import _load_state, summarize_runs
 from agentic_workflows.orchestration.langgraph.state_schema import new_run_state
 
 
@@ -84,6 +84,13 @@ class RunAuditTests(unittest.TestCase):
             self.assertEqual(len(rows), 1)
             self.assertIn("fib_len_", rows[0].issue_flags)
 
+    def test_load_state_falls_back_for_non_standard_json(self) -> None:
+        self.assertEqual(_load_state('{"step": 2}'), {"step": 2})
+        state = _load_state('{"score": NaN, "step": 1}')
+        self.assertEqual(state["step"], 1)
+        self.assertNotEqual(state["score"], state["score"])
+        self.assertEqual(_load_state("[1, 2]"), {})
+
 
 if __name__ == "__main__":
     unittest.main()
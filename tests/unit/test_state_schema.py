@@ -11,7 +11,9 @@ import typing
 
 from agentic_workflows.orchestration.langgraph.state_schema import (
     RunState,
+    compact_json,
     ensure_state_defaults,
+    tool_signature,
 )
 
 # ---------------------------------------------------------------------------
@@ -48,6 +50,25 @@ def test_seen_tool_signatures_is_plain_set():
     assert origin is set, f"Expected set origin, got {origin}"
 
 
+def test_compact_json_handles_wide_ints_and_unicode():
+    """Big Fibonacci ints fall back to stdlib json; output shape is the same either way."""
+    import json
+
+    assert compact_json({"a": [1, 2], "b": "é"}) == '{"a":[1,2],"b":"é"}'
+    wide = {"fib": [218922995834555169026, 354224848179261915075]}
+    assert json.loads(compact_json(wide)) == wide
+
+
+def test_tool_signature_is_compact_and_key_order_independent():
+    """Signatures digest args (bounded length) and ignore dict key order."""
+    big = {"path": "fib.txt", "content": ",".join(str(i) for i in range(2000))}
+    sig = tool_signature("write_file", big)
+    assert sig.startswith("write_file:")
+    assert len(sig) == len("write_file:") + 32
+    assert sig == tool_signature("write_file", dict(reversed(list(big.items()))))
+    assert sig != tool_signature("write_file", {**big, "path": "other.txt"})
+
+
 def test_mission_reports_has_annotated_reducer():
     """RunState.mission_reports must be Annotated[list[MissionReport], operator.add]."""
     hints = typing.get_type_hints(RunState, include_extras=True)
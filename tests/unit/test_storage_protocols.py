@@ -29,3 +29,18 @@ def test_memo_store_concrete_satisfies_protocol():
     from agentic_workflows.orchestration.langgraph.memo_store import SQLiteMemoStore
     store = SQLiteMemoStore(db_path=":memory:")
     assert isinstance(store, MemoStore)
+
+
+def test_postgres_checkpoint_store_satisfies_protocol():
+    from unittest.mock import MagicMock
+
+    import pytest
+
+    pytest.importorskip("psycopg_pool")
+    from agentic_workflows.orchestration.langgraph.checkpoint_postgres import (
+        PostgresCheckpointStore,
+    )
+    # Message archiving is part of the protocol, so both backends must implement it
+    assert {"append_messages", "load_archived_messages"} <= set(dir(CheckpointStore))
+    store = PostgresCheckpointStore(MagicMock())
+    assert isinstance(store, CheckpointStore)
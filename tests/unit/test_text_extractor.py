@@ -40,6 +40,12 @@ class TestTextExtractor(unittest.TestCase):
         self.assertEqual(text_extractor.parse_csv_int_list("1, 2, -3"), [1, 2, -3])
         self.assertIsNone(text_extractor.parse_csv_int_list("1, nope, 3"))
 
+    def test_parse_csv_int_list_rejects_int_literal_extensions(self) -> None:
+        # int() alone would accept these; the token grammar is strictly -?digits.
+        self.assertIsNone(text_extractor.parse_csv_int_list("+1, 2"))
+        self.assertIsNone(text_extractor.parse_csv_int_list("1_000, 2"))
+        self.assertEqual(text_extractor.parse_csv_int_list(" , 4,, 5 "), [4, 5])
+
 
 if __name__ == "__main__":
     unittest.main()